@@ -1,6 +1,9 @@
 import inspect
 import sqlite3
-from collections.abc import ItemsView, Iterable, KeysView, Mapping, ValuesView
+import sys
+from collections.abc import Callable, ItemsView, Iterable, KeysView, Mapping, ValuesView
+from functools import cache, lru_cache, partial
+from itertools import batched, chain
 from textwrap import dedent
 from types import MappingProxyType
 from typing import Any, Final
@@ -16,17 +19,26 @@ from sp2genius.utils.class_introspection import (
 from sp2genius.utils.errors import err_msg
 from sp2genius.utils.identifier import is_valid_py_identifier
 
+from ..sql.constants import SQLITE_MAX_BIND_PARAMS
 from ..typing import (
     UNSET,
+    BasicFieldValue,
     FieldMeta,
     FieldName,
     ForeignKeyMapping,
+    InitFieldMap,
     PrimaryKeyNames,
     RefMapping,
     TableMeta,
     TableName,
 )
 
+# upper bound of cached SQL texts keyed by (entity class, column shape), shared by all entities
+_SQL_SHAPE_CACHE_SIZE: Final[int] = 256
+# multi-row VALUES statements hold at most this many rows, and bind at most SQLITE_MAX_BIND_PARAMS
+# parameters, the rest of a batch goes through executemany
+_MAX_ROWS_PER_STATEMENT: Final[int] = 500
+
 
 class EntityMeta(type):
     # Static attribute name for concrete entity flag
@@ -827,7 +839,10 @@ class BaseEntity(metaclass=EntityMeta):
         "TABLE_NAME",
     )
 
-    _BASE_SLOTS_SOURCE_NAME: Final[str] = "TABLE_META"
+    _BASE_EXTRA_SLOTS_SOURCE_NAME: Final[str] = "TABLE_META"  # every field gets its own slot
+
+    # (keyword, field name) pairs, if provided a specialized make_init_data classmethod is generated from them
+    _INIT_FIELD_MAP: InitFieldMap | None = None
 
     @classmethod
     def get_table_name(cls) -> TableName:
@@ -1022,6 +1037,107 @@ class BaseEntity(metaclass=EntityMeta):
         cls._validate_entity_configs()
         setattr(cls, concrete_flag, None)  # mark as a flag that this is a concrete entity class
 
+        if "_INIT_FIELD_MAP" in cls.__dict__:
+            cls._generate_make_init_data()
+
+        cls._precompute_sql()
+
+    @classmethod
+    def _precompute_sql(cls) -> None:
+        """
+        Build the SQL of the common shapes (full row, primary key only) once at class creation,
+        so the first writes never pay the SQL text generation. Other shapes are built lazily.
+        """
+        full_row = cls._get_field_names()
+        pk_only = tuple(name for name in full_row if name in cls._get_pk_name_set())
+        for cols in (full_row, pk_only):
+            cls._get_insert_sql(cols, False)
+            cls._get_insert_sql(cols, True)
+            cls._get_upsert_sql(cols)
+        # the batch form of the full row upsert (upsert_many_to_db)
+        cls._get_upsert_sql(full_row, cls._get_rows_per_statement(len(full_row)))
+        cls._get_exists_sql()
+
+    @classmethod
+    def _validate_init_field_map(cls) -> None:
+        init_field_map = cls._INIT_FIELD_MAP
+        if not isinstance(init_field_map, tuple) or not init_field_map:
+            raise TypeError(
+                err_msg(
+                    "_INIT_FIELD_MAP must be a non-empty tuple of (keyword, field name) pairs"
+                )
+            )
+
+        table_meta = cls.get_table_meta()
+        seen_kwargs: set[str] = set()
+        seen_fields: set[FieldName] = set()
+        for pair in init_field_map:
+            if not isinstance(pair, tuple) or len(pair) != 2:
+                raise TypeError(
+                    err_msg(
+                        f"_INIT_FIELD_MAP entries must be (keyword, field name) pairs, got {pair!r}"
+                    )
+                )
+            kwarg_name, field_name = pair
+            if is_valid_py_identifier(kwarg_name) != 0 or kwarg_name == "cls":
+                raise ValueError(
+                    err_msg(
+                        f"_INIT_FIELD_MAP keyword {kwarg_name!r} is not a valid parameter name"
+                    )
+                )
+            if field_name not in table_meta:
+                raise ValueError(
+                    err_msg(
+                        f"_INIT_FIELD_MAP field {field_name!r} is not a valid field of the entity"
+                    )
+                )
+            if kwarg_name in seen_kwargs:
+                raise ValueError(
+                    err_msg(
+                        f"_INIT_FIELD_MAP keyword {kwarg_name!r} is mapped more than once"
+                    )
+                )
+            if field_name in seen_fields:
+                raise ValueError(
+                    err_msg(
+                        f"_INIT_FIELD_MAP field {field_name!r} is mapped more than once"
+                    )
+                )
+            seen_kwargs.add(kwarg_name)
+            seen_fields.add(field_name)
+
+    @classmethod
+    def _generate_make_init_data(cls) -> None:
+        """
+        Generate the make_init_data classmethod of the class from its _INIT_FIELD_MAP.
+        The generated body checks each keyword against UNSET and writes it straight into the result dict,
+        so no full dict has to be built and then filtered on every call.
+        """
+        cls._validate_init_field_map()
+        init_field_map = cls._INIT_FIELD_MAP
+        assert init_field_map is not None, "static analysis hint (validated above)"
+
+        params = ", ".join(f"{kwarg_name}=UNSET" for kwarg_name, _ in init_field_map)
+        lines = [f"def make_init_data(cls, *, {params}):", "    data = {}"]
+        for kwarg_name, field_name in init_field_map:
+            lines.append(f"    if {kwarg_name} is not UNSET:")
+            lines.append(f"        data[{field_name!r}] = {kwarg_name}")
+        lines.append("    return data")
+
+        exec_namespace: dict[str, Any] = {"UNSET": UNSET}
+        exec("\n".join(lines), exec_namespace)
+        make_init_data = exec_namespace["make_init_data"]
+
+        table_meta = cls.get_table_meta()
+        make_init_data.__annotations__ = {
+            kwarg_name: table_meta[field_name].get_py_type() | BasicFieldValue
+            for kwarg_name, field_name in init_field_map
+        }
+        make_init_data.__annotations__["return"] = dict
+        make_init_data.__module__ = cls.__module__
+        make_init_data.__qualname__ = f"{cls.__qualname__}.make_init_data"
+        setattr(cls, "make_init_data", classmethod(make_init_data))
+
     @classmethod
     def get_pk_names(cls) -> PrimaryKeyNames:
         assert cls.PRIMARY_KEYS is not None
@@ -1087,7 +1203,9 @@ class BaseEntity(metaclass=EntityMeta):
         return self.set_field_value(fk_col, new_value)
 
     @classmethod
+    @cache
     def get_fk_name_ref_single_pk_entity(cls, entity_cls: type["SinglePkEntity"]) -> FieldName:
+        # resolved once per (class, referenced entity), the get_*_id accessors call it on every read
         assert (
             isinstance(entity_cls, type)
             and issubclass(entity_cls, SinglePkEntity)
@@ -1098,7 +1216,8 @@ class BaseEntity(metaclass=EntityMeta):
 
     def get_fk_value_ref_single_pk_entity(self, entity_cls: type["SinglePkEntity"]) -> Any:
         fk_col = self.get_fk_name_ref_single_pk_entity(entity_cls)
-        return self.get_field_value(fk_col)
+        # like get_pk_value: validated in __init__ and on every set_field_value, so read the slot directly
+        return getattr(self, fk_col)
 
     def set_fk_value_ref_single_pk_entity(
         self, entity_cls: type["SinglePkEntity"], new_value: Any
@@ -1107,37 +1226,17 @@ class BaseEntity(metaclass=EntityMeta):
         return self.set_field_value(fk_col, new_value)
 
     def get_field_value(self, field_name: FieldName) -> Any:
-        pk_set = set(self.get_pk_names())
-        table_meta = self.get_table_meta()
-
-        if field_name not in table_meta:
+        if field_name not in self.get_table_meta():
             raise ValueError(err_msg(f"field '{field_name}' is not a valid field of the entity"))
-        field_value = getattr(self, field_name, UNSET)
-        field_meta = table_meta[field_name]
-
-        if field_value is UNSET:
-            if field_name in pk_set:
-                raise ValueError(err_msg(f"primary key field '{field_name}' is not set"))
-            return field_value
-
-        if not field_meta.is_valid_value(field_value):
-            allowed_types = tuple(t.__name__ for t in field_meta.allowed_types())
-            if field_name in pk_set:
-                raise TypeError(
-                    err_msg(
-                        f"primary key field '{field_name}' must be of type {allowed_types}, got {type(field_value).__name__} instead"
-                    )
-                )
-            else:
-                raise TypeError(
-                    err_msg(
-                        f"field '{field_name}' must be of type {allowed_types}, got {type(field_value).__name__} instead"
-                    )
-                )
+        # every field slot is initialized in __init__, and its value validated there and on every
+        # set_field_value, so the read needs no type check (like get_pk_value)
+        field_value = getattr(self, field_name)
+        if field_value is UNSET and field_name in self._get_pk_name_set():
+            raise ValueError(err_msg(f"primary key field '{field_name}' is not set"))
         return field_value
 
     def set_field_value(self, field_name: FieldName, new_value: Any) -> None:
-        pk_set = set(self.get_pk_names())
+        pk_set = self._get_pk_name_set()
         table_meta = self.get_table_meta()
 
         if field_name not in table_meta:
@@ -1168,6 +1267,8 @@ class BaseEntity(metaclass=EntityMeta):
                         f"field '{field_name}' must be of type {allowed_types}, got {type(new_value).__name__} instead"
                     )
                 )
+        if type(new_value) is str and field_name in self._get_key_field_names():
+            new_value = sys.intern(new_value)
         setattr(self, field_name, new_value)
 
     @classmethod
@@ -1181,22 +1282,56 @@ class BaseEntity(metaclass=EntityMeta):
         return field_meta.get_py_type()
 
     @classmethod
-    def _validate_insert_data(cls, data: dict[FieldName, Any]) -> None:
+    @cache
+    def _get_table_meta_items(cls) -> tuple[tuple[FieldName, FieldMeta], ...]:
+        """
+        TABLE_META as a tuple of (field name, field meta) pairs, built once per class for the per-row loops.
+        """
+        return tuple(cls.get_table_meta().items())
+
+    @classmethod
+    @cache
+    def _get_field_names(cls) -> tuple[FieldName, ...]:
+        return tuple(cls.get_table_meta())
+
+    @classmethod
+    @cache
+    def _get_pk_name_set(cls) -> frozenset[FieldName]:
+        return frozenset(cls.get_pk_names())
+
+    @classmethod
+    @cache
+    def _get_key_field_names(cls) -> frozenset[FieldName]:
+        """
+        The primary and foreign key fields. Their string values (Spotify ids) recur across many entities,
+        so they are interned: one shared object per id, and id comparisons mostly hit the identity shortcut.
+        """
+        fk_names = {
+            fk_col for ref_mapping in cls.get_fk_mapping().values() for fk_col in ref_mapping.values()
+        }
+        return cls._get_pk_name_set() | fk_names
+
+    @classmethod
+    @cache
+    def _get_required_field_names(cls) -> frozenset[FieldName]:
         table_meta = cls.get_table_meta()
-        required = {f_name for f_name, f_meta in table_meta.items() if not f_meta.nullable}
-        provided = set(data.keys())
-        missing = required - provided
+        return frozenset(f_name for f_name, f_meta in table_meta.items() if not f_meta.nullable)
+
+    @classmethod
+    def _validate_insert_data(cls, data: dict[FieldName, Any]) -> None:
+        missing = cls._get_required_field_names() - data.keys()
         if missing:
-            raise ValueError(err_msg(f"missing required fields for INSERT: {missing}"))
+            raise ValueError(err_msg(f"missing required fields for INSERT: {set(missing)}"))
 
     @classmethod
     def _filter_data(cls, data: dict[FieldName, Any]) -> dict[FieldName, Any]:
         assert isinstance(data, dict)
-        table_meta = cls.get_table_meta()
+        # walk the cached field name tuple instead of probing TABLE_META per key,
+        # the result is in TABLE_META order whatever the order of data
         filtered_fields = {
             f_name: f_val
-            for f_name, f_val in data.items()
-            if f_name in table_meta and f_val is not UNSET
+            for f_name in cls._get_field_names()
+            if (f_val := data.get(f_name, UNSET)) is not UNSET
         }
         return filtered_fields
 
@@ -1219,6 +1354,111 @@ class BaseEntity(metaclass=EntityMeta):
         print("}")
         print()
 
+    @classmethod
+    @lru_cache(maxsize=_SQL_SHAPE_CACHE_SIZE)
+    def _get_insert_sql(
+        cls, cols: tuple[FieldName, ...], on_conflict: bool, n_rows: int = 1
+    ) -> str:
+        """
+        Build the INSERT statement for the given column shape and n_rows rows, with positional placeholders
+        in column order, row after row. The result is LRU-cached per (class, shape, n_rows),
+        so the hot path never rebuilds the SQL text.
+        """
+        cols_clause = ",\n    ".join(cols)
+        values_clause = cls._get_values_clause(len(cols), n_rows)
+        # the conflict clause must come before the statement terminator
+        conflict_clause = f"\nON CONFLICT({', '.join(cls.get_pk_names())}) DO NOTHING" if on_conflict else ""
+        # built line by line rather than dedent()-ed, the multi-line column clause would break dedent's common indent
+        return (
+            f"INSERT INTO {cls.get_table_name()} (\n"
+            f"    {cols_clause}\n"
+            f") VALUES {values_clause}"
+            f"{conflict_clause};\n"
+        )
+
+    @classmethod
+    @lru_cache(maxsize=_SQL_SHAPE_CACHE_SIZE)
+    def _get_update_sql(cls, update_cols: tuple[FieldName, ...]) -> str:
+        """
+        Build the UPDATE-by-primary-key statement for the given column shape (cached per (class, shape)),
+        with positional placeholders: the update columns in order, then the primary key names in order.
+        """
+        set_clause = ",\n    ".join(f"{col} = ?" for col in update_cols)
+        where_clause = " AND\n    ".join(f"{pk_col} = ?" for pk_col in cls.get_pk_names())
+        return (
+            f"UPDATE {cls.get_table_name()}\n"
+            "SET\n"
+            f"    {set_clause}\n"
+            "WHERE\n"
+            f"    {where_clause};\n"
+        )
+
+    @classmethod
+    @lru_cache(maxsize=_SQL_SHAPE_CACHE_SIZE)
+    def _get_upsert_sql(cls, cols: tuple[FieldName, ...], n_rows: int = 1) -> str:
+        """
+        Build the single-statement INSERT ... ON CONFLICT DO UPDATE for the given column shape and n_rows rows,
+        with positional placeholders in column order, row after row (cached per (class, shape, n_rows)).
+        Without non primary key columns, the conflict is simply ignored.
+        """
+        pk_names = cls.get_pk_names()
+        cols_clause = ",\n    ".join(cols)
+        values_clause = cls._get_values_clause(len(cols), n_rows)
+        update_cols = [col for col in cols if col not in pk_names]
+        if update_cols:
+            set_clause = ", ".join(f"{col} = excluded.{col}" for col in update_cols)
+            conflict_action = f"DO UPDATE SET {set_clause}"
+        else:
+            conflict_action = "DO NOTHING"
+        return (
+            f"INSERT INTO {cls.get_table_name()} (\n"
+            f"    {cols_clause}\n"
+            f") VALUES {values_clause}\n"
+            f"ON CONFLICT({', '.join(pk_names)}) {conflict_action};\n"
+        )
+
+    @staticmethod
+    def _get_values_clause(n_cols: int, n_rows: int) -> str:
+        row_placeholders = f"({', '.join(['?'] * n_cols)})"
+        return ", ".join([row_placeholders] * n_rows)
+
+    @staticmethod
+    def _get_rows_per_statement(n_cols: int) -> int:
+        return max(1, min(_MAX_ROWS_PER_STATEMENT, SQLITE_MAX_BIND_PARAMS // n_cols))
+
+    @staticmethod
+    def _execute_rows(
+        cur: sqlite3.Cursor,
+        get_sql: Callable[..., str],
+        n_cols: int,
+        rows: Iterable[tuple[Any, ...]],
+    ) -> None:
+        """
+        Write rows of n_cols values with multi-row VALUES statements of _get_rows_per_statement(n_cols) rows,
+        the remainder through a single executemany, so at most two SQL texts are used per shape.
+        get_sql() returns the (cached) single-row statement, get_sql(n_rows) the one for n_rows rows.
+        """
+        rows_per_statement = BaseEntity._get_rows_per_statement(n_cols)
+        for chunk in batched(rows, rows_per_statement):
+            if len(chunk) == rows_per_statement > 1:
+                cur.execute(get_sql(rows_per_statement), tuple(chain.from_iterable(chunk)))
+            else:
+                cur.executemany(get_sql(), chunk)
+
+    @classmethod
+    @cache
+    def _get_exists_sql(cls) -> str:
+        """
+        Build the SELECT-by-primary-key existence probe (cached per class),
+        with positional placeholders in the order of the primary key names.
+        """
+        where_clause = " AND\n    ".join(f"{pk_col} = ?" for pk_col in cls.get_pk_names())
+        return (
+            f"SELECT 1 FROM {cls.get_table_name()}\n"
+            "WHERE\n"
+            f"    {where_clause};\n"
+        )
+
     @classmethod
     def is_concrete_entity(cls) -> bool:
         mcls = type(cls)
@@ -1256,10 +1496,9 @@ class BaseEntity(metaclass=EntityMeta):
 
     @classmethod
     def validate_data(cls, data: dict[FieldName, Any]) -> None:
-        pk_set: set[FieldName] = set(cls.get_pk_names())
-        table_meta = cls.get_table_meta()
+        pk_set = cls._get_pk_name_set()
 
-        for field_name, field_meta in table_meta.items():
+        for field_name, field_meta in cls._get_table_meta_items():
             if field_name in data:
                 field_value = data[field_name]
                 if not field_meta.is_valid_value(
@@ -1277,18 +1516,24 @@ class BaseEntity(metaclass=EntityMeta):
     def __init__(self, data: dict[FieldName, Any]) -> None:
         data = self._filter_data(data)  # filter out UNSET fields and non-TABLE_META fields
         self.validate_data(data)
-        for field_name, field_value in data.items():
+        # initialize every field slot, so reads never need a getattr default
+        key_names = self._get_key_field_names()
+        for field_name in self._get_field_names():
+            field_value = data.get(field_name, UNSET)
+            if type(field_value) is str and field_name in key_names:
+                field_value = sys.intern(field_value)
             setattr(self, field_name, field_value)
 
     def validate_fields(self) -> dict[FieldName, Any]:
-        table_meta = self.get_table_meta()
+        # collect the current set field values in a single pass (identity check against UNSET),
+        # the keys come from TABLE_META so no further filtering is needed
         data = {
-            field_name: getattr(self, field_name, UNSET) for field_name in table_meta
-        }  # get current field values, default to UNSET if missing
-        # filter out UNSET fields
-        filtered_data = self._filter_data(data)
-        self.validate_data(filtered_data)
-        return filtered_data
+            field_name: field_value
+            for field_name in self._get_field_names()
+            if (field_value := getattr(self, field_name)) is not UNSET
+        }
+        self.validate_data(data)
+        return data
 
     def insert_to_db(
         self,
@@ -1299,26 +1544,52 @@ class BaseEntity(metaclass=EntityMeta):
         if not simulate and not cur:
             raise ValueError(err_msg("'cur' is required"))
 
-        pk_names = self.get_pk_names()
         data = self.validate_fields()
         self._validate_insert_data(data)
-        cols = ",\n    ".join(data.keys())
-        placeholders = ",\n    ".join(f":{col}" for col in data.keys())
-        sql = dedent(f"""
-        INSERT INTO {self.get_table_name()} (
-            {cols}
-        ) VALUES (
-            {placeholders}
-        );
-        """)
-        if on_conflict:
-            pks = ", ".join(pk_names)
-            sql += f"ON CONFLICT({pks}) DO NOTHING"
+        sql = self._get_insert_sql(tuple(data), on_conflict)
         if not simulate:
-            cur.execute(sql, data)
+            # positional binding, the SQL columns were taken from data, so the values are in the same order
+            cur.execute(sql, tuple(data.values()))
         else:
             self._simulate_sql_exc(sql, data)
 
+    @classmethod
+    def insert_many_to_db(
+        cls,
+        cur: sqlite3.Cursor,
+        entities: Iterable["BaseEntity"],
+        simulate: bool = False,
+        on_conflict: bool = False,
+    ) -> None:
+        """
+        Insert several entities of this class, issuing one executemany per column shape.
+        """
+        if not simulate and not cur:
+            raise ValueError(err_msg("'cur' is required"))
+
+        rows_by_shape: dict[tuple[FieldName, ...], list[dict[FieldName, Any]]] = {}
+        for entity in entities:
+            if type(entity) is not cls:
+                raise TypeError(
+                    err_msg(f"expected {cls.__name__} entities, got {type(entity).__name__}")
+                )
+            data = entity.validate_fields()
+            cls._validate_insert_data(data)
+            rows_by_shape.setdefault(tuple(data), []).append(data)
+
+        for cols, rows in rows_by_shape.items():
+            sql = cls._get_insert_sql(cols, on_conflict)
+            if not simulate:
+                cls._execute_rows(
+                    cur,
+                    partial(cls._get_insert_sql, cols, on_conflict),
+                    len(cols),
+                    (tuple(data.values()) for data in rows),
+                )
+            else:
+                for data in rows:
+                    cls._simulate_sql_exc(sql, data)
+
     def update_fields_db(
         self,
         cur: sqlite3.Cursor,
@@ -1329,20 +1600,12 @@ class BaseEntity(metaclass=EntityMeta):
 
         pk_names = self.get_pk_names()
         data = self.validate_fields()
-        update_cols = [k for k in data.keys() if k not in pk_names]
+        update_cols = tuple(k for k in data.keys() if k not in pk_names)
         if not update_cols:
             return False  # nothing to update
-        set_clause = ",\n    ".join(f"{col} = :{col}" for col in update_cols)
-        where_clause = " AND\n    ".join(f"{pk_col} = :{pk_col}" for pk_col in pk_names)
-        sql = dedent(f"""
-        UPDATE {self.get_table_name()}
-        SET
-            {set_clause}
-        WHERE
-            {where_clause};
-        """)
+        sql = self._get_update_sql(update_cols)
         if not simulate:
-            cur.execute(sql, data)
+            cur.execute(sql, tuple(data[col] for col in update_cols + pk_names))
             if cur.rowcount > 0:
                 return True  # row existed and has been patched
         else:
@@ -1353,27 +1616,74 @@ class BaseEntity(metaclass=EntityMeta):
         if not simulate and not cur:
             raise ValueError(err_msg("'cur' is required"))
 
-        # 1) Try UPDATE (patch existing row)
+        data = self.validate_fields()
+        # 1) All required fields are known: a single INSERT ... ON CONFLICT DO UPDATE statement
+        if self._get_required_field_names() <= data.keys():
+            sql = self._get_upsert_sql(tuple(data))
+            if not simulate:
+                cur.execute(sql, tuple(data.values()))
+            else:
+                self._simulate_sql_exc(sql, data)
+            return
+
+        # 2) Partial patch: SQLite checks NOT NULL constraints of the INSERT half before resolving the conflict,
+        # so only an existing row can be patched (UPDATE), the INSERT fallback reports the missing fields
         row_updated = self.update_fields_db(cur=cur, simulate=simulate)
         if row_updated:
             return
-
-        # 2) If no row was updated, try INSERT with the provided columns
         self.insert_to_db(cur=cur, simulate=simulate, on_conflict=False)
 
+    @classmethod
+    def upsert_many_to_db(
+        cls,
+        cur: sqlite3.Cursor,
+        entities: Iterable["BaseEntity"],
+        simulate: bool = False,
+    ) -> None:
+        """
+        Upsert several entities of this class, issuing one executemany per column shape.
+        Entities lacking required fields (partial patches) fall back to upsert_to_db one by one.
+        """
+        if not simulate and not cur:
+            raise ValueError(err_msg("'cur' is required"))
+
+        required_names = cls._get_required_field_names()
+        rows_by_shape: dict[tuple[FieldName, ...], list[dict[FieldName, Any]]] = {}
+        partial_entities: list[BaseEntity] = []
+        for entity in entities:
+            if type(entity) is not cls:
+                raise TypeError(
+                    err_msg(f"expected {cls.__name__} entities, got {type(entity).__name__}")
+                )
+            data = entity.validate_fields()
+            if required_names <= data.keys():
+                rows_by_shape.setdefault(tuple(data), []).append(data)
+            else:
+                partial_entities.append(entity)
+
+        for cols, rows in rows_by_shape.items():
+            sql = cls._get_upsert_sql(cols)
+            if not simulate:
+                cls._execute_rows(
+                    cur,
+                    partial(cls._get_upsert_sql, cols),
+                    len(cols),
+                    (tuple(data.values()) for data in rows),
+                )
+            else:
+                for data in rows:
+                    cls._simulate_sql_exc(sql, data)
+        for entity in partial_entities:
+            entity.upsert_to_db(cur=cur, simulate=simulate)
+
     def exists_in_db(self, cur: sqlite3.Cursor, simulate: bool = False) -> bool:
         if not simulate and not cur:
             raise ValueError(err_msg("'cur' is required"))
 
         pk_names = self.get_pk_names()
         data = self.validate_fields()
-        where_clause = " AND\n    ".join(f"{pk_col} = :{pk_col}" for pk_col in pk_names)
-        params = {pk_col: data[pk_col] for pk_col in pk_names}
-        sql = dedent(f"""
-        SELECT 1 FROM {self.get_table_name()}
-        WHERE
-            {where_clause};
-        """)
+        params = tuple(data[pk_col] for pk_col in pk_names)
+        sql = self._get_exists_sql()
         if not simulate:
             cur.execute(sql, params)
             row = cur.fetchone()
@@ -1402,8 +1712,8 @@ class SinglePkEntity(BaseEntity):
         return cls.get_pk_names()[0]
 
     def get_pk_value(self) -> Any:
-        pk_name = self.get_pk_name()
-        return self.get_field_value(pk_name)
+        # the primary key is validated in __init__ and on every set_field_value, so read the slot directly
+        return getattr(self, self.get_pk_name())
 
     def set_pk_value(self, pk_value: Any) -> None:
         pk_name = self.get_pk_name()
@@ -1529,7 +1839,83 @@ class BinaryAssociationEntity(BaseEntity):
         simulate: bool = False,
         on_conflict: bool = False,
     ) -> None:
-        super().insert_to_db(cur=cur, simulate=simulate, on_conflict=True)
+        if not self._has_pk_only_fields():
+            super().insert_to_db(cur=cur, simulate=simulate, on_conflict=True)
+            return
+        # a pure primary key row goes straight to the cached pk-row statement, no data dict or shape lookup
+        # (the primary key slots are validated in __init__ and on every set_field_value)
+        pk_row = tuple(getattr(self, pk_name) for pk_name in self.get_pk_names())
+        self.insert_pk_row(cur=cur, pk_row=pk_row, simulate=simulate)
+
+    @classmethod
+    @cache
+    def _has_pk_only_fields(cls) -> bool:
+        return cls._get_pk_name_set() == frozenset(cls._get_field_names())
+
+    @classmethod
+    def insert_many_to_db(
+        cls,
+        cur: sqlite3.Cursor,
+        entities: Iterable[BaseEntity],
+        simulate: bool = False,
+        on_conflict: bool = False,
+    ) -> None:
+        super().insert_many_to_db(cur=cur, entities=entities, simulate=simulate, on_conflict=True)
+
+    @classmethod
+    def _precompute_sql(cls) -> None:
+        super()._precompute_sql()
+        # the association rows' fast path
+        cls._get_insert_pk_row_sql()
+        cls._get_insert_pk_row_sql(cls._get_rows_per_statement(len(cls.get_pk_names())))
+
+    @classmethod
+    @cache
+    def _get_insert_pk_row_sql(cls, n_rows: int = 1) -> str:
+        """
+        Build the positional INSERT ... ON CONFLICT DO NOTHING statement for n_rows full primary key rows
+        (cached per (class, n_rows)). The placeholders follow the order of the primary key names, row after row.
+        """
+        pk_names = cls.get_pk_names()
+        cols = ", ".join(pk_names)
+        values = cls._get_values_clause(len(pk_names), n_rows)
+        return f"INSERT INTO {cls.get_table_name()} ({cols}) VALUES {values} ON CONFLICT({cols}) DO NOTHING;"
+
+    @classmethod
+    def insert_pk_row(
+        cls,
+        cur: sqlite3.Cursor,
+        pk_row: tuple[Any, ...],
+        simulate: bool = False,
+    ) -> None:
+        """
+        Insert a single association row given as a tuple ordered like the primary key names,
+        without constructing an entity object.
+        """
+        cls.insert_many_pk_rows(cur=cur, pk_rows=(pk_row,), simulate=simulate)
+
+    @classmethod
+    def insert_many_pk_rows(
+        cls,
+        cur: sqlite3.Cursor,
+        pk_rows: Iterable[tuple[Any, ...]],
+        simulate: bool = False,
+    ) -> None:
+        """
+        Insert association rows given as tuples ordered like the primary key names,
+        without constructing entity objects. Rows that already exist are ignored.
+        Rows are written with multi-row INSERT statements, the remainder through a single executemany.
+        """
+        if not simulate and not cur:
+            raise ValueError(err_msg("'cur' is required"))
+
+        sql = cls._get_insert_pk_row_sql()
+        if not simulate:
+            cls._execute_rows(cur, cls._get_insert_pk_row_sql, len(cls.get_pk_names()), pk_rows)
+        else:
+            pk_names = cls.get_pk_names()
+            for pk_row in pk_rows:
+                cls._simulate_sql_exc(sql, dict(zip(pk_names, pk_row, strict=True)))
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
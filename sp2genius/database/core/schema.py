@@ -1,13 +1,57 @@
 from typing import Final
 
-from ..genius import GENIUS_TABLES
-from ..spotify import SPOTIFY_TABLES
+from ..genius import GENIUS_INDEXES, GENIUS_TABLES, GENIUS_UNIQUE_INDEXES
+from ..spotify import SPOTIFY_INDEXES, SPOTIFY_TABLES
 from .sql import FOREIGN_KEYS, STRICT_TABLES
-from .typing import CreateStatement
+from .typing import CreateStatement, TableName
 
 SQL_PRAGMA_STATEMENT: Final[str] = f"PRAGMA foreign_keys = {'ON' if FOREIGN_KEYS else 'OFF'};"
+# Only applies while the database file is still empty (before WAL and the first table), a no-op afterwards
+SQL_PAGE_SIZE_PRAGMA_STATEMENT: Final[str] = "PRAGMA page_size = 8192;"
+SQL_WAL_PRAGMA_STATEMENT: Final[str] = "PRAGMA journal_mode = WAL;"
+SQL_WAL_CHECKPOINT_PRAGMA_STATEMENT: Final[str] = "PRAGMA wal_checkpoint(PASSIVE);"
+SQL_TUNING_PRAGMA_STATEMENTS: Final[tuple[str, ...]] = (
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -64000;",
+    "PRAGMA mmap_size = 268435456;",  # 256 MiB of memory-mapped reads, ignored for in-memory dbs
+)
+# Every per-connection PRAGMA in one script, page_size first since WAL fixes the page size of a new file
+SQL_CONNECTION_PRAGMA_SCRIPT: Final[str] = "\n".join(
+    (
+        SQL_PAGE_SIZE_PRAGMA_STATEMENT,
+        SQL_WAL_PRAGMA_STATEMENT,
+        *SQL_TUNING_PRAGMA_STATEMENTS,
+        SQL_PRAGMA_STATEMENT,
+    )
+)
+# Same without WAL, which does not apply to in-memory databases
+SQL_IN_MEMORY_CONNECTION_PRAGMA_SCRIPT: Final[str] = "\n".join(
+    (
+        SQL_PAGE_SIZE_PRAGMA_STATEMENT,
+        *SQL_TUNING_PRAGMA_STATEMENTS,
+        SQL_PRAGMA_STATEMENT,
+    )
+)
+# Read-only connections share the database's WAL mode and only take the tuning PRAGMAs
+SQL_READER_PRAGMA_SCRIPT: Final[str] = "\n".join(SQL_TUNING_PRAGMA_STATEMENTS)
+SQL_OPTIMIZE_PRAGMA_STATEMENT: Final[str] = "PRAGMA optimize;"
+# on open: also analyze tables that were never analyzed (0x10000), limited work so opening stays cheap
+SQL_OPEN_OPTIMIZE_PRAGMA_STATEMENT: Final[str] = "PRAGMA optimize = 0x10002;"
+# mirrors the schema_meta version in the database header, read without touching any table
+SQL_USER_VERSION_PRAGMA_STATEMENT: Final[str] = "PRAGMA user_version;"
+# per-transaction, SQLite resets it on every COMMIT/ROLLBACK
+SQL_DEFER_FOREIGN_KEYS_PRAGMA_STATEMENT: Final[str] = "PRAGMA defer_foreign_keys = ON;"
+# Connections stay in autocommit mode, write transactions are opened explicitly and take the write lock up front
+SQL_BEGIN_IMMEDIATE_STATEMENT: Final[str] = "BEGIN IMMEDIATE;"
+SQL_COMMIT_STATEMENT: Final[str] = "COMMIT;"
+SQL_ROLLBACK_STATEMENT: Final[str] = "ROLLBACK;"
 
 CURRENT_SCHEMA_VERSION: Final[int] = 1
+# PRAGMA user_version, the header revision of the current schema. A database only reaches it once schema_meta
+# holds CURRENT_SCHEMA_VERSION and every index exists, bump it whenever existing databases need new indexes.
+# 2: unique genius_url indexes, genius song order index, discography track index
+SCHEMA_USER_VERSION: Final[int] = 2
 
 SCHEMA_META_TABLE_NAME: Final[str] = "schema_meta"
 SCHEMA_META_ID_COLUMN: Final[str] = "id"
@@ -23,11 +67,45 @@ CREATE TABLE IF NOT EXISTS {SCHEMA_META_TABLE_NAME} (
 """
 
 
-CREATE_STATEMENT_LST: list[CreateStatement] = GENIUS_TABLES + SPOTIFY_TABLES
-for statement in CREATE_STATEMENT_LST:
+def _terminate_statement(statement: CreateStatement) -> CreateStatement:
     statement = statement.strip()
-    if not statement.endswith(";"):
-        statement += ";"
-    CREATE_STATEMENT_LST.append(statement)
+    return statement if statement.endswith(";") else statement + ";"
+
+
+CREATE_STATEMENT_LST: list[CreateStatement] = [
+    _terminate_statement(statement) for statement in GENIUS_TABLES + SPOTIFY_TABLES
+]
 
 SQL_CREATE_STATEMENTS: Final[str] = "\n".join(CREATE_STATEMENT_LST)
+
+# Idempotent (IF NOT EXISTS), applied to existing databases once, when their user_version is behind
+SQL_CREATE_INDEX_STATEMENTS: Final[tuple[CreateStatement, ...]] = tuple(
+    GENIUS_INDEXES + SPOTIFY_INDEXES
+)
+
+# UNIQUE index statement -> (table, column, probe for one duplicated value), an existing database may
+# already hold duplicates, which would make the CREATE UNIQUE INDEX fail
+SQL_UNIQUE_INDEX_DUPLICATE_PROBES: Final[dict[CreateStatement, tuple[TableName, str, str]]] = {
+    statement: (
+        table_name,
+        column,
+        f"SELECT {column} FROM {table_name} GROUP BY {column} HAVING COUNT(*) > 1 LIMIT 1;",
+    )
+    for (table_name, column), statement in GENIUS_UNIQUE_INDEXES.items()
+}
+
+# PRAGMA does not accept bound parameters, SCHEMA_USER_VERSION is a trusted int constant
+SQL_SET_USER_VERSION_PRAGMA_STATEMENT: Final[str] = (
+    f"PRAGMA user_version = {int(SCHEMA_USER_VERSION)};"
+)
+
+# Brand-new database in one script: tables, schema_meta version row, indexes and user_version
+SQL_INIT_SCHEMA_SCRIPT: Final[str] = "\n".join(
+    (
+        SQL_CREATE_STATEMENTS,
+        f"INSERT INTO {SCHEMA_META_TABLE_NAME} ({SCHEMA_META_ID_COLUMN}, {SCHEMA_META_VERSION_COLUMN}) "
+        f"VALUES ({int(VALID_SCHEMA_ID)}, {int(CURRENT_SCHEMA_VERSION)});",
+        *SQL_CREATE_INDEX_STATEMENTS,
+        SQL_SET_USER_VERSION_PRAGMA_STATEMENT,
+    )
+)
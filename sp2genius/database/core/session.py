@@ -1,7 +1,10 @@
 import sqlite3
-from collections.abc import Sequence
+import warnings
+from collections.abc import Iterable, Iterator, Sequence
 from contextlib import contextmanager
+from itertools import batched
 from pathlib import Path
+from typing import Any
 
 import genius.manager as genius_manager
 import spotify.manager as spotify_manager
@@ -22,49 +25,125 @@ from .schema import (
     SCHEMA_META_TABLE,
     SCHEMA_META_TABLE_NAME,
     SCHEMA_META_VERSION_COLUMN,
-    SQL_CREATE_STATEMENTS,
-    SQL_PRAGMA_STATEMENT,
+    SCHEMA_USER_VERSION,
+    SQL_BEGIN_IMMEDIATE_STATEMENT,
+    SQL_COMMIT_STATEMENT,
+    SQL_CONNECTION_PRAGMA_SCRIPT,
+    SQL_CREATE_INDEX_STATEMENTS,
+    SQL_DEFER_FOREIGN_KEYS_PRAGMA_STATEMENT,
+    SQL_IN_MEMORY_CONNECTION_PRAGMA_SCRIPT,
+    SQL_INIT_SCHEMA_SCRIPT,
+    SQL_OPEN_OPTIMIZE_PRAGMA_STATEMENT,
+    SQL_OPTIMIZE_PRAGMA_STATEMENT,
+    SQL_READER_PRAGMA_SCRIPT,
+    SQL_ROLLBACK_STATEMENT,
+    SQL_SET_USER_VERSION_PRAGMA_STATEMENT,
+    SQL_UNIQUE_INDEX_DUPLICATE_PROBES,
+    SQL_USER_VERSION_PRAGMA_STATEMENT,
+    SQL_WAL_CHECKPOINT_PRAGMA_STATEMENT,
     VALID_SCHEMA_ID,
 )
+from .sql import FOREIGN_KEYS
 
 
 class Session:
     """
     Manages the SQLite database connection and ensures the schema is initialized.
+    The session's connection is the single writer, reads can use separate read-only connections (see reader()).
 
     Class Attributes:
         DEFAULT_DB_PATH (Path): The default path to the database file.
+        IN_MEMORY_DB_PATH (str): The special path for an in-memory database.
+        DEFAULT_CACHED_STATEMENTS (int): The size of the connection's prepared statement cache.
+        DEFAULT_BUSY_TIMEOUT (float): Seconds to wait on a locked database (SQLite busy_timeout) before failing.
+        DEFAULT_BULK_BATCH_SIZE (int): The number of songs committed per transaction by insert_songs_bulk.
 
     Instance Attributes:
         db_path (Path): The path to the database file.
         conn (sqlite3.Connection | None): The active database connection.
+        cur (sqlite3.Cursor | None): The connection's long-lived cursor, reused by every write helper.
+        reader_conn (sqlite3.Connection | None): The read-only connection handed out by reader(), opened lazily.
         initialized (bool): Indicates whether the database schema has been initialized.
     """
 
     DEFAULT_DB_PATH: Path = DB_PATH
     DEFAULT_ROW_FACTORY = sqlite3.Row
+    IN_MEMORY_DB_PATH: str = ":memory:"
+    # room for every entity SQL text the entity layer may cache (256) plus the fixed manager and session statements
+    DEFAULT_CACHED_STATEMENTS: int = 512
+    DEFAULT_BUSY_TIMEOUT: float = 5.0
+    DEFAULT_BULK_BATCH_SIZE: int = 500
 
     def __init__(self, db_path: str | Path | None = None):
         self.db_path: Path = self._resolve_db_path(db_path)
         self.conn: sqlite3.Connection | None = None
+        self.cur: sqlite3.Cursor | None = None
+        self.reader_conn: sqlite3.Connection | None = None
         self.initialized: bool = False
 
     @contextmanager
     def transaction(self):
         if self.conn is None:
             raise RuntimeError(err_msg("Database connection is not open."))
+        Session._begin(self.conn)
         try:
+            # Foreign key violations are reported at COMMIT instead of per statement, so the rows of
+            # one unit of work may be written in any order (the whole transaction rolls back on a violation)
+            self.conn.execute(SQL_DEFER_FOREIGN_KEYS_PRAGMA_STATEMENT)
             yield self.conn
+            self.conn.execute(SQL_COMMIT_STATEMENT)  # <-- deferred foreign keys are validated here
         except Exception:
-            self.conn.rollback()  # <-- runs only if with-block raised
+            Session._rollback(self.conn)  # <-- runs if the with-block or the commit raised
             raise
-        else:
-            self.conn.commit()  # <-- runs only if with-block did NOT raise
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield the session's read-only connection to the database for the with-block.
+        Under WAL its reads see the last committed state and never wait on (or block) the session's writes.
+        It is opened on first use and kept until close(), so its page and statement caches stay warm.
+        In-memory databases are private to the session's connection, which is yielded instead.
+        """
+        if self.conn is None:
+            raise RuntimeError(err_msg("Database connection is not open."))
+        if self.is_in_memory():
+            yield self.conn
+            return
+
+        if self.reader_conn is None:
+            conn = sqlite3.connect(
+                database=f"{self.db_path.as_uri()}?mode=ro",
+                timeout=self.DEFAULT_BUSY_TIMEOUT,
+                cached_statements=self.DEFAULT_CACHED_STATEMENTS,
+                autocommit=True,
+                uri=True,
+            )
+            try:
+                conn.row_factory = self.DEFAULT_ROW_FACTORY
+                conn.executescript(SQL_READER_PRAGMA_SCRIPT)
+            except Exception:
+                conn.close()
+                raise
+            self.reader_conn = conn
+        yield self.reader_conn
+
+    @staticmethod
+    def _begin(conn: sqlite3.Connection) -> None:
+        # BEGIN IMMEDIATE takes the write lock now (waiting up to busy_timeout), instead of a deferred
+        # BEGIN upgrading its read lock mid-transaction, which fails with SQLITE_BUSY without retrying
+        conn.execute(SQL_BEGIN_IMMEDIATE_STATEMENT)
+
+    @staticmethod
+    def _rollback(conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.execute(SQL_ROLLBACK_STATEMENT)
 
     @classmethod
     def _resolve_db_path(cls, db_path: str | Path | None) -> Path:
         if db_path is None:
             db_path = cls.DEFAULT_DB_PATH
+        elif db_path == cls.IN_MEMORY_DB_PATH:
+            return Path(db_path)
 
         p = get_absolute_path(db_path)
         if p is None:
@@ -77,13 +156,23 @@ class Session:
         if self.conn is not None:
             return
 
-        conn = sqlite3.connect(database=self.db_path, autocommit=False)
+        # The connection stays in autocommit mode: connection-level PRAGMAs cannot take effect
+        # inside a transaction, and write transactions are opened explicitly (see transaction()).
+        conn = sqlite3.connect(
+            database=self.db_path,
+            timeout=self.DEFAULT_BUSY_TIMEOUT,
+            cached_statements=self.DEFAULT_CACHED_STATEMENTS,
+            autocommit=True,
+        )
         conn.row_factory = self.DEFAULT_ROW_FACTORY
 
         try:
-            conn.execute(SQL_PRAGMA_STATEMENT)
+            self.configure_connection(conn, in_memory=self.is_in_memory())
+            # refresh stale planner statistics up front (close() runs the regular PRAGMA optimize)
+            conn.execute(SQL_OPEN_OPTIMIZE_PRAGMA_STATEMENT)
 
             if not self.initialized:
+                # cheap on an up-to-date database, _ensure_initialized returns after reading PRAGMA user_version
                 self._ensure_initialized(conn)
                 self.initialized = True
         except Exception:
@@ -91,16 +180,62 @@ class Session:
             raise
         else:
             self.conn = conn
+            self.cur = conn.cursor()
+
+    def is_in_memory(self) -> bool:
+        return str(self.db_path) == self.IN_MEMORY_DB_PATH
+
+    @staticmethod
+    def configure_connection(conn: sqlite3.Connection, in_memory: bool = False) -> None:
+        """
+        Apply the per-connection PRAGMAs. Must be called while the connection is in autocommit mode.
+
+        WAL lets readers run concurrently with a writer and syncs less often per commit
+        (synchronous=NORMAL is durable against application crashes, a power loss may roll back the last commits).
+        Under heavy write concurrency, WAL can surface more 'database is locked' errors,
+        so writers should keep their transactions short. WAL is skipped for in-memory databases.
+        WAL keeps committed data durable across process exits and normal shutdowns.
+        Reads are served through a memory map of up to 256 MiB, sparing a copy into SQLite's page cache.
+        A brand-new database file is created with 8 KiB pages, so typical rows need fewer overflow pages
+        (existing files keep their page size).
+        """
+        # one precomputed script instead of a round trip per PRAGMA
+        conn.executescript(
+            SQL_IN_MEMORY_CONNECTION_PRAGMA_SCRIPT if in_memory else SQL_CONNECTION_PRAGMA_SCRIPT
+        )
+        # Set once per connection (never per call), verify it here since SQLite silently ignores it in a transaction
+        (foreign_keys,) = conn.execute("PRAGMA foreign_keys;").fetchone()
+        if bool(foreign_keys) != FOREIGN_KEYS:
+            raise RuntimeError(err_msg(f"failed to set foreign_keys = {FOREIGN_KEYS} on the connection"))
 
     def close(self) -> None:
         if self.conn is None:
             return
-        self.conn.close()
-        self.conn = None
+        try:
+            # Uncommitted work is discarded on close anyway, run PRAGMA optimize on its own
+            Session._rollback(self.conn)
+            self.conn.execute(SQL_OPTIMIZE_PRAGMA_STATEMENT)
+        finally:
+            if self.reader_conn is not None:
+                self.reader_conn.close()
+                self.reader_conn = None
+            if self.cur is not None:
+                self.cur.close()
+                self.cur = None
+            self.conn.close()
+            self.conn = None
 
     @staticmethod
     def _ensure_initialized(conn: sqlite3.Connection) -> None:
+        Session._begin(conn)
         try:
+            # Fast path: the header's user_version is only set once schema_meta holds the current version
+            # and every index exists, so a matching value skips all DDL and the schema_meta lookup
+            (user_version,) = conn.execute(SQL_USER_VERSION_PRAGMA_STATEMENT).fetchone()
+            if user_version == SCHEMA_USER_VERSION:
+                conn.execute(SQL_COMMIT_STATEMENT)
+                return
+
             # Ensure schema_meta exists
             conn.execute(SCHEMA_META_TABLE)
 
@@ -111,13 +246,9 @@ class Session:
             ).fetchone()
 
             if row is None:
-                # Brand-new DB: create all tables and set version
-                conn.executescript(SQL_CREATE_STATEMENTS)
-                conn.execute(
-                    f"INSERT INTO {SCHEMA_META_TABLE_NAME} ({SCHEMA_META_ID_COLUMN}, {SCHEMA_META_VERSION_COLUMN}) VALUES (:id, :version)",
-                    {"id": VALID_SCHEMA_ID, "version": CURRENT_SCHEMA_VERSION},
-                )
-                conn.commit()
+                # Brand-new DB: tables, version row, indexes and user_version in one script (same transaction)
+                conn.executescript(SQL_INIT_SCHEMA_SCRIPT)
+                conn.execute(SQL_COMMIT_STATEMENT)
                 return
 
             db_version = row[0]
@@ -137,10 +268,42 @@ class Session:
                         "Please update the application."
                     )
                 )
+
+            # One-time upgrade of an existing database to the current header revision
+            # (a newer user_version comes from a newer application and is left as is)
+            if user_version < SCHEMA_USER_VERSION and Session._ensure_indexes(conn):
+                conn.execute(SQL_SET_USER_VERSION_PRAGMA_STATEMENT)
+            conn.execute(SQL_COMMIT_STATEMENT)
         except Exception:
-            conn.rollback()
+            Session._rollback(conn)
             raise
 
+    @staticmethod
+    def _ensure_indexes(conn: sqlite3.Connection) -> bool:
+        """
+        Create any missing index of an existing database.
+        A UNIQUE index is skipped with a warning while its column still holds duplicate values,
+        so opening the database never fails on them. Returns whether every index is now in place.
+        """
+        all_created = True
+        for statement in SQL_CREATE_INDEX_STATEMENTS:
+            if statement in SQL_UNIQUE_INDEX_DUPLICATE_PROBES:
+                table_name, column, probe_sql = SQL_UNIQUE_INDEX_DUPLICATE_PROBES[statement]
+                duplicate = conn.execute(probe_sql).fetchone()
+                if duplicate is not None:
+                    warnings.warn(
+                        err_msg(
+                            f"{table_name}.{column} holds duplicate values (e.g. {duplicate[0]!r}), "
+                            "its unique index is not created until the duplicates are removed."
+                        ),
+                        RuntimeWarning,
+                        stacklevel=2,
+                    )
+                    all_created = False
+                    continue
+            conn.execute(statement)
+        return all_created
+
     def insert_song_spotify_data(
         self,
         *,
@@ -149,9 +312,9 @@ class Session:
         album: tuple[Album, Sequence[AlbumImage]],
         featured_artists: Sequence[tuple[Artist, Sequence[ArtistImage]]],
     ) -> None:
-        with self.transaction() as conn:
+        with self.transaction():
             spotify_manager.insert_spotify_song(
-                conn,
+                self.cur,
                 song=song,
                 primary_artist=primary_artist,
                 album=album,
@@ -166,9 +329,9 @@ class Session:
         album: GeniusAlbumInfo,
         featured_artists: Sequence[GeniusArtistInfo],
     ) -> None:
-        with self.transaction() as conn:
+        with self.transaction():
             genius_manager.insert_genius_song_info(
-                conn,
+                self.cur,
                 song=song,
                 primary_artist=primary_artist,
                 album=album,
@@ -271,35 +434,109 @@ class Session:
         genius_primary_artist: GeniusArtistInfo | None = None,
         genius_album: GeniusAlbumInfo | None = None,
         genius_featured_artists: Sequence[GeniusArtistInfo] | None = None,
-    ):
-        spotify_data = {
-            "song": spotify_song,
-            "primary_artist": spotify_primary_artist,
-            "album": spotify_album,
-            "featured_artists": spotify_featured_artists,
-        }
-        genius_data = {
-            "song": genius_song,
-            "primary_artist": genius_primary_artist,
-            "album": genius_album,
-            "featured_artists": genius_featured_artists,
-        }
-        assert all(v is not None for v in spotify_data.values()) or all(
-            v is None for v in spotify_data.values()
-        ), err_msg("Spotify data must be either fully provided or fully omitted.")
-        insert_spotify_data: bool = spotify_data["song"] is not None
-
-        assert all(v is not None for v in genius_data.values()) or all(
-            v is None for v in genius_data.values()
-        ), err_msg("Genius data must be either fully provided or fully omitted.")
-        insert_genius_data: bool = genius_data["song"] is not None
+    ) -> None:
+        with self.transaction():
+            self._write_song(
+                spotify_song=spotify_song,
+                spotify_primary_artist=spotify_primary_artist,
+                spotify_album=spotify_album,
+                spotify_featured_artists=spotify_featured_artists,
+                genius_song=genius_song,
+                genius_primary_artist=genius_primary_artist,
+                genius_album=genius_album,
+                genius_featured_artists=genius_featured_artists,
+            )
+
+    def insert_songs_bulk(
+        self,
+        bundles: Iterable[dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> int:
+        """
+        Insert many songs, each bundle holds the keyword arguments of insert_song.
+        Songs are written in batches of batch_size, one transaction (and a single commit) per batch instead of per song.
+        After every batch a passive WAL checkpoint runs, so the WAL file of a long ingest stays bounded.
+        If a song fails, its batch is rolled back and the error is raised, earlier batches stay committed.
+        Returns the number of inserted songs.
+        """
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError(err_msg("batch_size must be a positive integer"))
+
+        n_songs = 0
+        for batch in batched(bundles, batch_size):
+            with self.transaction():
+                for bundle in batch:
+                    self._write_song(**bundle)
+            n_songs += len(batch)
+            if not self.is_in_memory():
+                # right after the commit, nothing is pending on this connection
+                self.conn.execute(SQL_WAL_CHECKPOINT_PRAGMA_STATEMENT)
+        return n_songs
+
+    def _write_song(
+        self,
+        *,
+        spotify_song: Song | None = None,
+        spotify_primary_artist: tuple[Artist, Sequence[ArtistImage]] | None = None,
+        spotify_album: tuple[Album, Sequence[AlbumImage]] | None = None,
+        spotify_featured_artists: Sequence[tuple[Artist, Sequence[ArtistImage]]] | None = None,
+        genius_song: GeniusSongInfo | None = None,
+        genius_primary_artist: GeniusArtistInfo | None = None,
+        genius_album: GeniusAlbumInfo | None = None,
+        genius_featured_artists: Sequence[GeniusArtistInfo] | None = None,
+    ) -> None:
+        """
+        Write one song's spotify and/or genius data on the session cursor, inside the caller's transaction.
+        """
+        # short-circuiting checks on the arguments themselves, no per-song dicts or generator scans
+        spotify_complete = (
+            spotify_song is not None
+            and spotify_primary_artist is not None
+            and spotify_album is not None
+            and spotify_featured_artists is not None
+        )
+        if not spotify_complete and not (
+            spotify_song is None
+            and spotify_primary_artist is None
+            and spotify_album is None
+            and spotify_featured_artists is None
+        ):
+            raise ValueError(err_msg("Spotify data must be either fully provided or fully omitted."))
+        insert_spotify_data: bool = spotify_complete
+
+        genius_complete = (
+            genius_song is not None
+            and genius_primary_artist is not None
+            and genius_album is not None
+            and genius_featured_artists is not None
+        )
+        if not genius_complete and not (
+            genius_song is None
+            and genius_primary_artist is None
+            and genius_album is None
+            and genius_featured_artists is None
+        ):
+            raise ValueError(err_msg("Genius data must be either fully provided or fully omitted."))
+        insert_genius_data: bool = genius_complete
 
         if not insert_spotify_data and not insert_genius_data:
             raise ValueError(err_msg("At least one of Spotify or Genius data must be provided."))
         elif not insert_spotify_data and insert_genius_data:
-            self.insert_song_genius_data(**genius_data)
+            genius_manager.insert_genius_song_info(
+                self.cur,
+                song=genius_song,
+                primary_artist=genius_primary_artist,
+                album=genius_album,
+                featured_artists=genius_featured_artists,
+            )
         elif insert_spotify_data and not insert_genius_data:
-            self.insert_song_spotify_data(**spotify_data)
+            spotify_manager.insert_spotify_song(
+                self.cur,
+                song=spotify_song,
+                primary_artist=spotify_primary_artist,
+                album=spotify_album,
+                featured_artists=spotify_featured_artists,
+            )
         else:
             assert (
                 spotify_song is not None
@@ -334,12 +571,17 @@ class Session:
             for spotify_artist, genius_artist in matching_featured_artists:
                 spotify_artist.set_genius_id(genius_artist.get_id())
 
-            with self.transaction() as conn:
-                genius_manager.insert_genius_song_info(
-                    conn,
-                    **genius_data,
-                )
-                spotify_manager.insert_spotify_song(
-                    conn,
-                    **spotify_data,
-                )
+            genius_manager.insert_genius_song_info(
+                self.cur,
+                song=genius_song,
+                primary_artist=genius_primary_artist,
+                album=genius_album,
+                featured_artists=genius_featured_artists,
+            )
+            spotify_manager.insert_spotify_song(
+                self.cur,
+                song=spotify_song,
+                primary_artist=spotify_primary_artist,
+                album=spotify_album,
+                featured_artists=spotify_featured_artists,
+            )
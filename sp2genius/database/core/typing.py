@@ -13,6 +13,7 @@ TableName: TypeAlias = str
 PrimaryKeyNames: TypeAlias = tuple[FieldName, ...]
 RefMapping: TypeAlias = dict[FieldName, FieldName]
 ForeignKeyMapping: TypeAlias = dict[TableName, RefMapping]
+InitFieldMap: TypeAlias = tuple[tuple[str, FieldName], ...]  # (make_init_data keyword, field name) pairs
 
 
 def type_lookups(cls: type["SqlColType"]) -> type["SqlColType"]:
@@ -1,5 +1,9 @@
+from .tables import INDEXES as GENIUS_INDEXES
 from .tables import TABLES as GENIUS_TABLES
+from .tables import UNIQUE_INDEXES as GENIUS_UNIQUE_INDEXES
 
 __all__ = [
+    "GENIUS_INDEXES",
     "GENIUS_TABLES",
+    "GENIUS_UNIQUE_INDEXES",
 ]
@@ -1,21 +1,27 @@
 import sqlite3
+from collections.abc import Sequence
+from functools import cache
 
 from ..core.entity.base import BinaryAssociationEntity, SinglePkEntity
-from ..core.typing import UNSET, BasicFieldValue
+from ..core.typing import BasicFieldValue
 from .tables import (
     GENIUS_ALBUM_INFO_TABLE_FOREIGN_KEYS,
+    GENIUS_ALBUM_INFO_TABLE_INIT_FIELD_MAP,
     GENIUS_ALBUM_INFO_TABLE_META,
     GENIUS_ALBUM_INFO_TABLE_NAME,
     GENIUS_ALBUM_INFO_TABLE_PRIMARY_KEYS,
     GENIUS_ARTIST_INFO_TABLE_FOREIGN_KEYS,
+    GENIUS_ARTIST_INFO_TABLE_INIT_FIELD_MAP,
     GENIUS_ARTIST_INFO_TABLE_META,
     GENIUS_ARTIST_INFO_TABLE_NAME,
     GENIUS_ARTIST_INFO_TABLE_PRIMARY_KEYS,
     GENIUS_DISCOGRAPHY_TABLE_FOREIGN_KEYS,
+    GENIUS_DISCOGRAPHY_TABLE_INIT_FIELD_MAP,
     GENIUS_DISCOGRAPHY_TABLE_META,
     GENIUS_DISCOGRAPHY_TABLE_NAME,
     GENIUS_DISCOGRAPHY_TABLE_PRIMARY_KEYS,
     GENIUS_SONG_INFO_TABLE_FOREIGN_KEYS,
+    GENIUS_SONG_INFO_TABLE_INIT_FIELD_MAP,
     GENIUS_SONG_INFO_TABLE_META,
     GENIUS_SONG_INFO_TABLE_NAME,
     GENIUS_SONG_INFO_TABLE_PRIMARY_KEYS,
@@ -60,31 +66,11 @@ class GeniusEntity(SinglePkEntity):
 
 class GeniusAlbumInfo(GeniusEntity):
     TABLE_META = GENIUS_ALBUM_INFO_TABLE_META
+    _INIT_FIELD_MAP = GENIUS_ALBUM_INFO_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = GENIUS_ALBUM_INFO_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = GENIUS_ALBUM_INFO_TABLE_FOREIGN_KEYS
     TABLE_NAME = GENIUS_ALBUM_INFO_TABLE_NAME
 
-    @classmethod
-    def make_init_data(
-        cls,
-        *,
-        album_genius_id: int | BasicFieldValue = UNSET,
-        album_title: str | BasicFieldValue = UNSET,
-        album_genius_url: str | BasicFieldValue = UNSET,
-        primary_artist_genius_id: int | BasicFieldValue = UNSET,
-        release_date: str | BasicFieldValue = UNSET,
-        album_image_url: str | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_id_col_name(): album_genius_id,
-            cls.get_title_col_name(): album_title,
-            cls.get_genius_url_col_name(): album_genius_url,
-            cls.get_primary_artist_id_col_name(): primary_artist_genius_id,
-            "release_date": release_date,
-            cls.get_image_url_col_name(): album_image_url,
-        }
-        return cls._filter_data(fields)
-
     @classmethod
     def get_primary_artist_id_col_name(cls) -> str:
         return cls.get_fk_name_ref_single_pk_entity(GeniusArtistInfo)
@@ -110,39 +96,11 @@ class GeniusAlbumInfo(GeniusEntity):
 
 class GeniusSongInfo(GeniusEntity):
     TABLE_META = GENIUS_SONG_INFO_TABLE_META
+    _INIT_FIELD_MAP = GENIUS_SONG_INFO_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = GENIUS_SONG_INFO_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = GENIUS_SONG_INFO_TABLE_FOREIGN_KEYS
     TABLE_NAME = GENIUS_SONG_INFO_TABLE_NAME
 
-    @classmethod
-    def make_init_data(
-        cls,
-        *,
-        song_genius_id: int | BasicFieldValue = UNSET,
-        song_title: str | BasicFieldValue = UNSET,
-        song_genius_url: str | BasicFieldValue = UNSET,
-        primary_artist_genius_id: int | BasicFieldValue = UNSET,
-        album_genius_id: int | BasicFieldValue = UNSET,
-        release_date: str | BasicFieldValue = UNSET,
-        song_image_url: str | BasicFieldValue = UNSET,
-        apple_music_id: str | BasicFieldValue = UNSET,
-        youtube_video_id: str | BasicFieldValue = UNSET,
-        language: str | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_id_col_name(): song_genius_id,
-            cls.get_title_col_name(): song_title,
-            cls.get_genius_url_col_name(): song_genius_url,
-            cls.get_primary_artist_id_col_name(): primary_artist_genius_id,
-            cls.get_album_id_col_name(): album_genius_id,
-            "release_date": release_date,
-            cls.get_image_url_col_name(): song_image_url,
-            "apple_music_id": apple_music_id,
-            "youtube_video_id": youtube_video_id,
-            "language": language,
-        }
-        return cls._filter_data(fields)
-
     @classmethod
     def get_primary_artist_id_col_name(cls) -> str:
         return cls.get_fk_name_ref_single_pk_entity(GeniusArtistInfo)
@@ -175,25 +133,41 @@ class GeniusSongInfo(GeniusEntity):
         title_col_name = self.get_title_col_name()
         self.set_field_value(title_col_name, new_title)
 
+    @classmethod
+    def get_order_by_cols(cls) -> list[str]:
+        return [
+            cls.get_primary_artist_id_col_name(),
+            cls.get_album_id_col_name(),
+            cls.get_title_col_name(),
+        ]
+
 
 class GeniusDiscographyEntry(BinaryAssociationEntity):
     TABLE_META = GENIUS_DISCOGRAPHY_TABLE_META
+    _INIT_FIELD_MAP = GENIUS_DISCOGRAPHY_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = GENIUS_DISCOGRAPHY_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = GENIUS_DISCOGRAPHY_TABLE_FOREIGN_KEYS
     TABLE_NAME = GENIUS_DISCOGRAPHY_TABLE_NAME
 
     @classmethod
-    def make_init_data(
+    def make_pk_row(
         cls,
         *,
-        artist_genius_id: int | BasicFieldValue = UNSET,
-        song_genius_id: int | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_artist_id_col_name(): artist_genius_id,
-            cls.get_song_id_col_name(): song_genius_id,
-        }
-        return cls._filter_data(fields)
+        artist_genius_id: int,
+        song_genius_id: int,
+    ) -> tuple[int, int]:
+        """
+        Build a primary key row ordered like PRIMARY_KEYS, for the insert_pk_row/insert_many_pk_rows fast path.
+        """
+        if cls._is_artist_id_first_pk():
+            return artist_genius_id, song_genius_id
+        return song_genius_id, artist_genius_id
+
+    @classmethod
+    @cache
+    def _is_artist_id_first_pk(cls) -> bool:
+        # resolved once per class, so make_pk_row builds its tuple without any per-row lookups
+        return cls.get_pk_names()[0] == cls.get_artist_id_col_name()
 
     @classmethod
     def get_artist_id_col_name(cls) -> str:
@@ -218,6 +192,7 @@ class GeniusDiscographyEntry(BinaryAssociationEntity):
 
 class GeniusArtistInfo(GeniusEntity):
     TABLE_META = GENIUS_ARTIST_INFO_TABLE_META
+    _INIT_FIELD_MAP = GENIUS_ARTIST_INFO_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = GENIUS_ARTIST_INFO_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = GENIUS_ARTIST_INFO_TABLE_FOREIGN_KEYS
     TABLE_NAME = GENIUS_ARTIST_INFO_TABLE_NAME
@@ -228,29 +203,24 @@ class GeniusArtistInfo(GeniusEntity):
         song: GeniusSongInfo,
         simulate: bool = False,
     ) -> None:
-        entry_data = GeniusDiscographyEntry.make_init_data(
+        pk_row = GeniusDiscographyEntry.make_pk_row(
             artist_genius_id=self.get_id(),
             song_genius_id=song.get_id(),
         )
-        entry = GeniusDiscographyEntry(data=entry_data)
-        entry.insert_to_db(cur=cur, simulate=simulate)
+        GeniusDiscographyEntry.insert_pk_row(cur=cur, pk_row=pk_row, simulate=simulate)
 
-    @classmethod
-    def make_init_data(
-        cls,
-        *,
-        artist_genius_id: int | BasicFieldValue = UNSET,
-        artist_name: str | BasicFieldValue = UNSET,
-        artist_genius_url: str | BasicFieldValue = UNSET,
-        artist_image_url: str | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_id_col_name(): artist_genius_id,
-            cls.get_name_col_name(): artist_name,
-            cls.get_genius_url_col_name(): artist_genius_url,
-            cls.get_image_url_col_name(): artist_image_url,
-        }
-        return cls._filter_data(fields)
+    def register_discography_entries(
+        self,
+        cur: sqlite3.Cursor,
+        songs: Sequence[GeniusSongInfo],
+        simulate: bool = False,
+    ) -> None:
+        artist_id = self.get_id()
+        pk_rows = [
+            GeniusDiscographyEntry.make_pk_row(artist_genius_id=artist_id, song_genius_id=song.get_id())
+            for song in songs
+        ]
+        GeniusDiscographyEntry.insert_many_pk_rows(cur=cur, pk_rows=pk_rows, simulate=simulate)
 
     @classmethod
     def get_name_col_name(cls) -> str:
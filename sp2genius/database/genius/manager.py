@@ -1,23 +1,59 @@
+import json
 import sqlite3
 from collections.abc import Sequence
+from typing import Final
 
 from sp2genius.utils.errors import err_msg
 
+from ..core.sql.fragments import generate_order_by_clause
 from .entities import GeniusAlbumInfo, GeniusArtistInfo, GeniusDiscographyEntry, GeniusSongInfo
 
 
+# Built once at import time, so every call reuses the same SQL text (and the connection's statement cache entry)
+_SQL_SONGS_FOR_ARTIST: Final[str] = f"""
+SELECT {GeniusDiscographyEntry.get_song_id_col_name()}
+FROM {GeniusDiscographyEntry.get_table_name()}
+WHERE {GeniusDiscographyEntry.get_artist_id_col_name()} = :aid
+"""
+
+# The artist ids are bound as a single JSON array, so one prepared statement serves every number of artists
+_SQL_JOINT_SONGS: Final[str] = f"""
+SELECT s.*
+FROM {GeniusSongInfo.get_table_name()} AS s
+JOIN (
+    SELECT d.{GeniusDiscographyEntry.get_song_id_col_name()}
+    FROM {GeniusDiscographyEntry.get_table_name()} AS d
+    WHERE d.{GeniusDiscographyEntry.get_artist_id_col_name()} IN (SELECT value FROM json_each(:artist_ids))
+    GROUP BY d.{GeniusDiscographyEntry.get_song_id_col_name()}
+    HAVING COUNT(DISTINCT d.{GeniusDiscographyEntry.get_artist_id_col_name()}) = :n_artists
+) AS t
+  ON t.{GeniusDiscographyEntry.get_song_id_col_name()} = s.{GeniusSongInfo.get_id_col_name()}
+{generate_order_by_clause("s", GeniusSongInfo.get_order_by_cols())};
+"""
+
+_SQL_EXISTING_ARTIST_IDS: Final[str] = f"""
+SELECT {GeniusArtistInfo.get_id_col_name()}
+FROM {GeniusArtistInfo.get_table_name()}
+WHERE {GeniusArtistInfo.get_id_col_name()} IN (SELECT value FROM json_each(:artist_ids))
+"""
+
+
 def _ensure_discography_entries(
     cur: sqlite3.Cursor,
     song: GeniusSongInfo,
     artists: Sequence[GeniusArtistInfo],
 ) -> None:
-    for artist in artists:
-        artist.register_discography_entry(cur, song)
+    song_id = song.get_id()
+    pk_rows = [
+        GeniusDiscographyEntry.make_pk_row(artist_genius_id=artist.get_id(), song_genius_id=song_id)
+        for artist in artists
+    ]
+    GeniusDiscographyEntry.insert_many_pk_rows(cur=cur, pk_rows=pk_rows)
 
 
 # --- Public API: insert_song --------------------------------------------------
 def insert_genius_song_info(
-    conn: sqlite3.Connection,
+    cur: sqlite3.Cursor,
     *,
     song: GeniusSongInfo,
     primary_artist: GeniusArtistInfo,
@@ -27,70 +63,76 @@ def insert_genius_song_info(
     """
     Insert or patch a song, its main artist, album, and discography entries.
     For featured artists, pass an empty list if none exist.
+    All writes share the caller's transaction (Session.transaction), which makes them atomic with a single commit.
+    Rows are written parents first: artists -> album -> song -> discography, so every foreign key holds
+    when its row is written (Session.transaction defers the checks to COMMIT anyway).
     """
 
-    cur = conn.cursor()
-
-    # 1. main artist (only set what we know)
-    primary_artist.upsert_to_db(cur)
-
-    # 2. featured artists (if provided)
-    for feat_artist in featured_artists:
-        feat_artist.upsert_to_db(cur)
-
-    all_artists = [primary_artist] + list(featured_artists)
+    # 1-2. main artist + featured artists (only set what we know), one executemany batch per column shape
+    all_artists = (primary_artist, *featured_artists)
+    GeniusArtistInfo.upsert_many_to_db(cur=cur, entities=all_artists)
 
     # 3. album (patch or insert)
-    if album.get_id() != song.get_album_id():
-        raise ValueError(
-            err_msg("Song's album_genius_id must match the provided album's genius_id")
-        )
-    if album.get_primary_artist_id() not in {artist.get_id() for artist in all_artists}:
-        raise ValueError(
-            err_msg(
-                "Album's primary_artist_genius_id must match one of the provided artists' genius_id"
+    # The caller-consistency checks below guard against API misuse only (the schema foreign keys
+    # already reject dangling ids), so they are skipped under python -O.
+    if __debug__:
+        if album.get_id() != song.get_album_id():
+            raise ValueError(
+                err_msg("Song's album_genius_id must match the provided album's genius_id")
+            )
+        album_primary_artist_id = album.get_primary_artist_id()
+        if not any(album_primary_artist_id == artist.get_id() for artist in all_artists):
+            raise ValueError(
+                err_msg(
+                    "Album's primary_artist_genius_id must match one of the provided artists' genius_id"
+                )
             )
-        )
     album.upsert_to_db(cur)
 
     # 4. song (patch or insert)
-    if song.get_primary_artist_id() != primary_artist.get_id():
-        raise ValueError(
-            err_msg(
-                "Song's primary_artist_genius_id must match the provided primary artist's genius_id"
+    if __debug__:
+        if song.get_primary_artist_id() != primary_artist.get_id():
+            raise ValueError(
+                err_msg(
+                    "Song's primary_artist_genius_id must match the provided primary artist's genius_id"
+                )
             )
-        )
     song.upsert_to_db(cur)
 
     # 5. discography entries: main artist + any featured artists
     _ensure_discography_entries(cur, song, all_artists)
 
 
+def _ensure_artists_exist(cur: sqlite3.Cursor, artists: Sequence[GeniusArtistInfo]) -> None:
+    """
+    Check the existence of all the given artists with a single query, reporting the first missing one.
+    """
+    artist_ids = list(dict.fromkeys(artist.get_id() for artist in artists))
+    cur.execute(_SQL_EXISTING_ARTIST_IDS, {"artist_ids": json.dumps(artist_ids)})
+    existing_ids = {row[0] for row in cur}
+    for artist_id in artist_ids:
+        if artist_id not in existing_ids:
+            raise ValueError(
+                err_msg(
+                    f"Artist '{artist_id}' does not exist in table '{GeniusArtistInfo.get_table_name()}'."
+                )
+            )
+
+
 def get_songs_for_artist(
     conn: sqlite3.Connection,
     artist: GeniusArtistInfo,
     strict: bool = False,
 ) -> set[str]:
     cur = conn.cursor()
+    cur.execute(_SQL_SONGS_FOR_ARTIST, {"aid": artist.get_id()})
+    # Stream rows from the cursor instead of materializing them with fetchall()
+    songs = {row[0] for row in cur}
 
-    if strict:
-        if not artist.exists_in_db(cur):
-            raise ValueError(
-                err_msg(
-                    f"Artist '{artist.get_id()}' does not exist in table '{GeniusArtistInfo.get_table_name()}'."
-                )
-            )
-
-    cur.execute(
-        f"""
-        SELECT {GeniusDiscographyEntry.get_song_id_col_name()}
-        FROM {GeniusDiscographyEntry.get_table_name()}
-        WHERE {GeniusDiscographyEntry.get_artist_id_col_name()} = :aid
-        """,
-        {"aid": artist.get_id()},
-    )
-    rows = cur.fetchall()
-    return {row[0] for row in rows}
+    # A discography entry implies the artist exists (foreign key), so only an empty result needs the existence check
+    if strict and not songs:
+        _ensure_artists_exist(cur, (artist,))
+    return songs
 
 
 def get_joint_songs_for_artists(
@@ -102,51 +144,28 @@ def get_joint_songs_for_artists(
     Given a list of artist_ids, return a list of sqlite3.Row objects representing
     songs that ALL of these artists participated in (intersection of their songs).
 
-    - Uses the discography table to find shared song_ids.
-    - Then fetches full rows from the songs table.
+    - Finds the shared song_ids in the discography table with GROUP BY/HAVING.
+    - Fetches the full rows from the songs table in the same query.
     - Result is sorted by: main_artist_id, then album_id, then title.
+    - Rows come from the connection's row factory (Session.open sets sqlite3.Row).
     """
     assert isinstance(artists, Sequence), err_msg("artists must be a sequence of Artist objects")
     if not artists:
         return []
 
-    # 1. Build the intersection of song IDs across all artists
-    song_sets: list[set[str]] = []
-    for artist in artists:
-        songs = get_songs_for_artist(conn, artist, strict=strict)
-        song_sets.append(songs)
-
-    # Start with a copy of the first set, then intersect with the rest
-    joint_songs: set[str] = set(song_sets[0])
-    for s in song_sets[1:]:
-        joint_songs.intersection_update(s)
-
-    if not joint_songs:
-        return []
+    cur = conn.cursor()
 
-    # 2. Fetch full song rows for all intersecting song_ids, using sqlite3.Row
-    song_list = list(joint_songs)
-    placeholders = ", ".join("?" for _ in song_list)
+    # Deduplicate (keeping the input order), so the HAVING count matches the number of distinct artists
+    artist_ids = list(dict.fromkeys(artist.get_id() for artist in artists))
 
-    cur = conn.cursor()
-    cur.row_factory = sqlite3.Row  # type: ignore
+    # Intersect, fetch and sort in a single query
     cur.execute(
-        f"""
-        SELECT *
-        FROM {GeniusSongInfo.get_table_name()}
-        WHERE {GeniusSongInfo.get_id_col_name()} IN ({placeholders})
-        """,
-        song_list,
+        _SQL_JOINT_SONGS,
+        {"artist_ids": json.dumps(artist_ids), "n_artists": len(artist_ids)},
     )
     songs = cur.fetchall()
 
-    # 3. Sort by main_artist_id, then album_id, then title
-    songs.sort(
-        key=lambda song: (
-            song[GeniusSongInfo.get_primary_artist_id_col_name()],
-            song[GeniusSongInfo.get_album_id_col_name()],
-            song[GeniusSongInfo.get_title_col_name()],
-        )
-    )
-
+    # A joint song implies every artist exists (foreign key), so only an empty result needs the existence checks
+    if strict and not songs:
+        _ensure_artists_exist(cur, artists)
     return songs
@@ -6,6 +6,7 @@ from ..core.typing import (
     CreateStatement,
     FieldMeta,
     ForeignKeyMapping,
+    InitFieldMap,
     PrimaryKeyNames,
     TableMeta,
     TableName,
@@ -17,6 +18,10 @@ def youtube_video_id_to_url(column: str, concat: str) -> str:
     return f"'https://www.youtube.com/watch?v=' {concat} {column}"
 
 
+def unique_index(table_name: TableName, column: str) -> CreateStatement:
+    return f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{table_name}_{column} ON {table_name}({column});"
+
+
 # ---- GENIUS TABLES + EXTENDED METADATA ---- #
 _strict_clause: str = " STRICT" if STRICT_TABLES else ""
 
@@ -39,9 +44,15 @@ GENIUS_ARTIST_INFO_TABLE_FOREIGN_KEYS: Final[ForeignKeyMapping] = {}
 GENIUS_ARTIST_INFO_TABLE_META: Final[TableMeta] = {
     "genius_id": FieldMeta(py_type=int, nullable=False),
     "name": FieldMeta(py_type=str, nullable=False),
-    "genius_url": FieldMeta(py_type=str, nullable=False),
+    "genius_url": FieldMeta(py_type=str, nullable=False, unique=True),
     "image_url": FieldMeta(py_type=str, nullable=True),
 }
+GENIUS_ARTIST_INFO_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("artist_genius_id", GENIUS_ARTIST_INFO_TABLE_PRIMARY_KEYS[0]),
+    ("artist_name", "name"),
+    ("artist_genius_url", "genius_url"),
+    ("artist_image_url", "image_url"),
+)
 
 # Genius Album Info Table
 GENIUS_ALBUM_INFO_TABLE_NAME: Final[TableName] = "genius_album_info"
@@ -73,11 +84,19 @@ GENIUS_ALBUM_INFO_TABLE_FOREIGN_KEYS: Final[ForeignKeyMapping] = {
 GENIUS_ALBUM_INFO_TABLE_META: Final[TableMeta] = {
     "genius_id": FieldMeta(py_type=int, nullable=False),
     "title": FieldMeta(py_type=str, nullable=False),
-    "genius_url": FieldMeta(py_type=str, nullable=False),
+    "genius_url": FieldMeta(py_type=str, nullable=False, unique=True),
     "primary_artist_genius_id": FieldMeta(py_type=int, nullable=False),
     "release_date": FieldMeta(py_type=str, nullable=False),
     "image_url": FieldMeta(py_type=str, nullable=True),
 }
+GENIUS_ALBUM_INFO_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("album_genius_id", GENIUS_ALBUM_INFO_TABLE_PRIMARY_KEYS[0]),
+    ("album_title", "title"),
+    ("album_genius_url", "genius_url"),
+    ("primary_artist_genius_id", GENIUS_ALBUM_INFO_TABLE_FOREIGN_KEYS[GENIUS_ARTIST_INFO_TABLE_NAME][GENIUS_ARTIST_INFO_TABLE_PRIMARY_KEYS[0]]),
+    ("release_date", "release_date"),
+    ("album_image_url", "image_url"),
+)
 
 # Genius Song Info Table
 GENIUS_SONG_INFO_TABLE_NAME: Final[TableName] = "genius_song_info"
@@ -107,11 +126,9 @@ CREATE TABLE IF NOT EXISTS {GENIUS_SONG_INFO_TABLE_NAME} (
                                  ),
     language                 TEXT
                                  CHECK (language IS NULL OR language GLOB '[a-z][a-z]'),
+    -- NULL propagates through concatenation, so a NULL youtube_video_id yields a NULL url without a CASE
     youtube_url              TEXT GENERATED ALWAYS AS (
-                                CASE
-                                    WHEN youtube_video_id IS NOT NULL THEN {youtube_video_id_to_url(column="youtube_video_id", concat=CONCAT)}
-                                    ELSE NULL
-                                END
+                                {youtube_video_id_to_url(column="youtube_video_id", concat=CONCAT)}
                              ) VIRTUAL,
 
     FOREIGN KEY (primary_artist_genius_id)
@@ -135,7 +152,7 @@ GENIUS_SONG_INFO_TABLE_FOREIGN_KEYS: Final[ForeignKeyMapping] = {
 GENIUS_SONG_INFO_TABLE_META: Final[TableMeta] = {
     "genius_id": FieldMeta(py_type=int, nullable=False),
     "title": FieldMeta(py_type=str, nullable=False),
-    "genius_url": FieldMeta(py_type=str, nullable=False),
+    "genius_url": FieldMeta(py_type=str, nullable=False, unique=True),
     "primary_artist_genius_id": FieldMeta(py_type=int, nullable=False),
     "album_genius_id": FieldMeta(py_type=int, nullable=False),
     "release_date": FieldMeta(py_type=str, nullable=False),
@@ -144,6 +161,18 @@ GENIUS_SONG_INFO_TABLE_META: Final[TableMeta] = {
     "youtube_video_id": FieldMeta(py_type=str, nullable=True),
     "language": FieldMeta(py_type=str, nullable=True),
 }
+GENIUS_SONG_INFO_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("song_genius_id", GENIUS_SONG_INFO_TABLE_PRIMARY_KEYS[0]),
+    ("song_title", "title"),
+    ("song_genius_url", "genius_url"),
+    ("primary_artist_genius_id", GENIUS_SONG_INFO_TABLE_FOREIGN_KEYS[GENIUS_ARTIST_INFO_TABLE_NAME][GENIUS_ARTIST_INFO_TABLE_PRIMARY_KEYS[0]]),
+    ("album_genius_id", GENIUS_SONG_INFO_TABLE_FOREIGN_KEYS[GENIUS_ALBUM_INFO_TABLE_NAME][GENIUS_ALBUM_INFO_TABLE_PRIMARY_KEYS[0]]),
+    ("release_date", "release_date"),
+    ("song_image_url", "image_url"),
+    ("apple_music_id", "apple_music_id"),
+    ("youtube_video_id", "youtube_video_id"),
+    ("language", "language"),
+)
 
 # Genius Discography Entry Table
 GENIUS_DISCOGRAPHY_TABLE_NAME: Final[TableName] = "genius_discography"
@@ -152,6 +181,7 @@ CREATE TABLE IF NOT EXISTS {GENIUS_DISCOGRAPHY_TABLE_NAME} (
     artist_genius_id INTEGER NOT NULL,
     song_genius_id   INTEGER NOT NULL,
 
+    -- The primary key index also covers lookups by artist_genius_id alone
     PRIMARY KEY (artist_genius_id, song_genius_id),
 
     FOREIGN KEY (artist_genius_id)
@@ -179,6 +209,10 @@ GENIUS_DISCOGRAPHY_TABLE_META: Final[TableMeta] = {
     "artist_genius_id": FieldMeta(py_type=int, nullable=False),
     "song_genius_id": FieldMeta(py_type=int, nullable=False),
 }
+GENIUS_DISCOGRAPHY_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("artist_genius_id", GENIUS_DISCOGRAPHY_TABLE_FOREIGN_KEYS[GENIUS_ARTIST_INFO_TABLE_NAME][GENIUS_ARTIST_INFO_TABLE_PRIMARY_KEYS[0]]),
+    ("song_genius_id", GENIUS_DISCOGRAPHY_TABLE_FOREIGN_KEYS[GENIUS_SONG_INFO_TABLE_NAME][GENIUS_SONG_INFO_TABLE_PRIMARY_KEYS[0]]),
+)
 
 # All Genius Tables Creation Statements in Order of Dependencies
 TABLES: Final[list[CreateStatement]] = [
@@ -187,3 +221,28 @@ TABLES: Final[list[CreateStatement]] = [
     GENIUS_SONG_INFO_TABLE,
     GENIUS_DISCOGRAPHY_TABLE,
 ]
+
+# ---- GENIUS INDEXES ---- #
+# Kept out of the CREATE TABLE statements, so they can be (re)applied idempotently to existing databases as well
+
+# Serves the (primary artist, album, title) ORDER BY of joint-song queries without a sort step
+GENIUS_SONG_INFO_ORDER_INDEX: Final[CreateStatement] = f"""
+CREATE INDEX IF NOT EXISTS idx_{GENIUS_SONG_INFO_TABLE_NAME}_order
+    ON {GENIUS_SONG_INFO_TABLE_NAME}(primary_artist_genius_id, album_genius_id, title);
+"""
+
+# (table, column) -> its UNIQUE index, an existing database is checked for duplicates before it gets one
+UNIQUE_INDEXES: Final[dict[tuple[TableName, str], CreateStatement]] = {
+    (table_name, column): unique_index(table_name, column)
+    for table_name, column in (
+        (GENIUS_ARTIST_INFO_TABLE_NAME, "genius_url"),
+        (GENIUS_ALBUM_INFO_TABLE_NAME, "genius_url"),
+        (GENIUS_SONG_INFO_TABLE_NAME, "genius_url"),
+    )
+}
+
+# All Genius Indexes Creation Statements (run after the tables exist)
+INDEXES: Final[list[CreateStatement]] = [
+    *UNIQUE_INDEXES.values(),
+    GENIUS_SONG_INFO_ORDER_INDEX,
+]
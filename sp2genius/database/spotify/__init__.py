@@ -1,5 +1,7 @@
+from .tables import INDEXES as SPOTIFY_INDEXES
 from .tables import TABLES as SPOTIFY_TABLES
 
 __all__ = [
+    "SPOTIFY_INDEXES",
     "SPOTIFY_TABLES",
 ]
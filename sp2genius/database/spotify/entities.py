@@ -1,33 +1,41 @@
 import sqlite3
+from collections.abc import Sequence
+from functools import cache
 
 from sp2genius.database.core.sql.fragments import generate_order_by_clause
 from sp2genius.utils.errors import err_msg
 
 from ..core.entity.base import BinaryAssociationEntity, DependentRowEntity, SinglePkEntity
-from ..core.typing import UNSET, BasicFieldValue
+from ..core.typing import BasicFieldValue
 from ..genius.entities import GeniusAlbumInfo, GeniusArtistInfo, GeniusEntity, GeniusSongInfo
 from .tables import (
     ALBUM_IMAGES_TABLE_FOREIGN_KEYS,
+    ALBUM_IMAGES_TABLE_INIT_FIELD_MAP,
     ALBUM_IMAGES_TABLE_META,
     ALBUM_IMAGES_TABLE_NAME,
     ALBUM_IMAGES_TABLE_PRIMARY_KEYS,
     ALBUMS_TABLE_FOREIGN_KEYS,
+    ALBUMS_TABLE_INIT_FIELD_MAP,
     ALBUMS_TABLE_META,
     ALBUMS_TABLE_NAME,
     ALBUMS_TABLE_PRIMARY_KEYS,
     ARTIST_IMAGES_TABLE_FOREIGN_KEYS,
+    ARTIST_IMAGES_TABLE_INIT_FIELD_MAP,
     ARTIST_IMAGES_TABLE_META,
     ARTIST_IMAGES_TABLE_NAME,
     ARTIST_IMAGES_TABLE_PRIMARY_KEYS,
     ARTISTS_TABLE_FOREIGN_KEYS,
+    ARTISTS_TABLE_INIT_FIELD_MAP,
     ARTISTS_TABLE_META,
     ARTISTS_TABLE_NAME,
     ARTISTS_TABLE_PRIMARY_KEYS,
     DISCOGRAPHY_TABLE_FOREIGN_KEYS,
+    DISCOGRAPHY_TABLE_INIT_FIELD_MAP,
     DISCOGRAPHY_TABLE_META,
     DISCOGRAPHY_TABLE_NAME,
     DISCOGRAPHY_TABLE_PRIMARY_KEYS,
     SONGS_TABLE_FOREIGN_KEYS,
+    SONGS_TABLE_INIT_FIELD_MAP,
     SONGS_TABLE_META,
     SONGS_TABLE_NAME,
     SONGS_TABLE_PRIMARY_KEYS,
@@ -50,21 +58,24 @@ class SpotifyEntity(SinglePkEntity):
                     f"Class '{cls.__name__}' does not."
                 )
             )
-        if not isinstance(cls.SPOTIFY_ENTITY_NAME, str):
+        # validated and normalized on a local, the class attribute is assigned once (and only if valid)
+        name = cls.__dict__["SPOTIFY_ENTITY_NAME"]
+        if not isinstance(name, str):
             raise TypeError(
                 err_msg(
                     f"SPOTIFY_ENTITY_NAME must be of type str. "
-                    f"Class '{cls.__name__}' has SPOTIFY_ENTITY_NAME of type '{type(cls.SPOTIFY_ENTITY_NAME).__name__}'."
+                    f"Class '{cls.__name__}' has SPOTIFY_ENTITY_NAME of type '{type(name).__name__}'."
                 )
             )
-        cls.SPOTIFY_ENTITY_NAME = cls.SPOTIFY_ENTITY_NAME.strip().lower()
-        if not cls.SPOTIFY_ENTITY_NAME:
+        name = name.strip().lower()
+        if not name:
             raise ValueError(
                 err_msg(
                     f"SPOTIFY_ENTITY_NAME cannot be an empty string. "
                     f"Class '{cls.__name__}' has SPOTIFY_ENTITY_NAME set to an empty string."
                 )
             )
+        cls.SPOTIFY_ENTITY_NAME = name
 
     @classmethod
     def get_id_col_name(cls) -> str:
@@ -85,9 +96,14 @@ class SpotifyEntity(SinglePkEntity):
             )
         )
 
+    @classmethod
+    @cache
+    def _get_spotify_url_prefix(cls) -> str:
+        return f"https://open.spotify.com/{cls.SPOTIFY_ENTITY_NAME}/"
+
     def get_spotify_url(self) -> str:
-        spotify_id = self.get_id()
-        return f"https://open.spotify.com/{self.SPOTIFY_ENTITY_NAME}/{spotify_id}"
+        # the per-class prefix is built once, each call is a single concatenation
+        return self._get_spotify_url_prefix() + self.get_id()
 
     def set_spotify_url(self, new_url: str) -> None:
         raise NotImplementedError(
@@ -111,27 +127,11 @@ class SpotifyEntity(SinglePkEntity):
 
 class ArtistImage(DependentRowEntity):
     TABLE_META = ARTIST_IMAGES_TABLE_META
+    _INIT_FIELD_MAP = ARTIST_IMAGES_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = ARTIST_IMAGES_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = ARTIST_IMAGES_TABLE_FOREIGN_KEYS
     TABLE_NAME = ARTIST_IMAGES_TABLE_NAME
 
-    @classmethod
-    def make_init_data(
-        cls,
-        *,
-        artist_spotify_id: str | BasicFieldValue = UNSET,
-        image_url: str | BasicFieldValue = UNSET,
-        image_width: int | BasicFieldValue = UNSET,
-        image_height: int | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_artist_id_col_name(): artist_spotify_id,
-            cls.get_url_col_name(): image_url,
-            "width": image_width,
-            "height": image_height,
-        }
-        return cls._filter_data(fields)
-
     @classmethod
     def get_artist_id_col_name(cls) -> str:
         return cls.get_fk_name_ref_single_pk_entity(Artist)
@@ -143,7 +143,9 @@ class ArtistImage(DependentRowEntity):
         self.set_fk_value_ref_single_pk_entity(Artist, new_id)
 
     @classmethod
+    @cache
     def get_url_col_name(cls) -> str:
+        # derived from the primary key names, resolved once per class (get_url/set_url call it per image)
         pk_names_set = set(cls.get_pk_names())
         artist_id_col_name = cls.get_artist_id_col_name()
         assert artist_id_col_name in pk_names_set and len(pk_names_set) == 2, err_msg(
@@ -164,41 +166,26 @@ class ArtistImage(DependentRowEntity):
 
 class AlbumImage(DependentRowEntity):
     TABLE_META = ALBUM_IMAGES_TABLE_META
+    _INIT_FIELD_MAP = ALBUM_IMAGES_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = ALBUM_IMAGES_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = ALBUM_IMAGES_TABLE_FOREIGN_KEYS
     TABLE_NAME = ALBUM_IMAGES_TABLE_NAME
 
-    @classmethod
-    def make_init_data(
-        cls,
-        *,
-        album_spotify_id: str | BasicFieldValue = UNSET,
-        image_url: str | BasicFieldValue = UNSET,
-        image_width: int | BasicFieldValue = UNSET,
-        image_height: int | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_album_id_col_name(): album_spotify_id,
-            cls.get_url_col_name(): image_url,
-            "width": image_width,
-            "height": image_height,
-        }
-        return cls._filter_data(fields)
-
     @classmethod
     def get_album_id_col_name(cls) -> str:
         return cls.get_fk_name_ref_single_pk_entity(Album)
 
     def get_album_id(self) -> str:
-        album_id_col_name = self.get_album_id_col_name()
-        return self.get_field_value(album_id_col_name)
+        return self.get_fk_value_ref_single_pk_entity(Album)
 
     def set_album_id(self, new_id: str) -> None:
         album_id_col_name = self.get_album_id_col_name()
         self.set_field_value(album_id_col_name, new_id)
 
     @classmethod
+    @cache
     def get_url_col_name(cls) -> str:
+        # derived from the primary key names, resolved once per class (get_url/set_url call it per image)
         pk_names_set = set(cls.get_pk_names())
         album_id_col_name = cls.get_album_id_col_name()
         assert album_id_col_name in pk_names_set and len(pk_names_set) == 2, err_msg(
@@ -219,67 +206,58 @@ class AlbumImage(DependentRowEntity):
 
 class Album(SpotifyEntity):
     TABLE_META = ALBUMS_TABLE_META
+    _INIT_FIELD_MAP = ALBUMS_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = ALBUMS_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = ALBUMS_TABLE_FOREIGN_KEYS
     TABLE_NAME = ALBUMS_TABLE_NAME
     SPOTIFY_ENTITY_NAME = "album"
 
+    def validate_image(self, image: AlbumImage) -> None:
+        self.validate_images((image,))
+
+    def validate_images(self, images: Sequence[AlbumImage]) -> None:
+        album_id = self.get_id()  # read once for the whole batch
+        for image in images:
+            if image.get_album_id() != album_id:
+                raise ValueError(err_msg("an image attached to an album must reference its album_id"))
+
     def register_image(
         self,
         cur: sqlite3.Cursor,
         image: AlbumImage,
         simulate: bool = False,
     ) -> None:
-        if self.get_id() != image.get_album_id():
-            raise ValueError(err_msg("an image attached to an album must reference its album_id"))
+        self.validate_image(image)
         image.upsert_to_db(cur=cur, simulate=simulate)
 
-    @classmethod
-    def make_init_data(
-        cls,
-        *,
-        album_spotify_id: str | BasicFieldValue = UNSET,
-        album_title: str | BasicFieldValue = UNSET,
-        album_genius_id: int | BasicFieldValue = UNSET,
-        primary_artist_id: str | BasicFieldValue = UNSET,
-        album_type: str | BasicFieldValue = UNSET,
-        total_tracks: int | BasicFieldValue = UNSET,
-        release_date: str | BasicFieldValue = UNSET,
-        label: str | BasicFieldValue = UNSET,
-        popularity: int | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_id_col_name(): album_spotify_id,
-            cls.get_title_col_name(): album_title,
-            cls.get_genius_id_col_name(): album_genius_id,
-            cls.get_primary_artist_id_col_name(): primary_artist_id,
-            "album_type": album_type,
-            "total_tracks": total_tracks,
-            "release_date": release_date,
-            "label": label,
-            "popularity": popularity,
-        }
-        return cls._filter_data(fields)
+    def register_images(
+        self,
+        cur: sqlite3.Cursor,
+        images: Sequence[AlbumImage],
+        simulate: bool = False,
+    ) -> None:
+        self.validate_images(images)
+        AlbumImage.upsert_many_to_db(cur=cur, entities=images, simulate=simulate)
 
     @classmethod
     def get_genius_id_col_name(
         cls,
         genius_entity_cls: type[GeniusEntity] | None = None,
     ) -> str:
-        return super().get_genius_id_col_name(GeniusAlbumInfo)
+        return cls.get_fk_name_ref_single_pk_entity(GeniusAlbumInfo)
 
     def get_genius_id(
         self,
         genius_entity_cls: type[GeniusEntity] | None = None,
     ) -> int | BasicFieldValue:
-        return super().get_genius_id(GeniusAlbumInfo)
+        return self.get_fk_value_ref_single_pk_entity(GeniusAlbumInfo)
 
     def set_genius_id(
         self,
         new_id: int | BasicFieldValue,
         genius_entity_cls: type[GeniusEntity] | None = None,
     ) -> None:
-        super().set_genius_id(new_id, GeniusAlbumInfo)
+        self.set_fk_value_ref_single_pk_entity(GeniusAlbumInfo, new_id)
 
     @classmethod
     def get_primary_artist_id_col_name(cls) -> str:
@@ -306,56 +284,28 @@ class Album(SpotifyEntity):
 
 class Song(SpotifyEntity):
     TABLE_META = SONGS_TABLE_META
+    _INIT_FIELD_MAP = SONGS_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = SONGS_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = SONGS_TABLE_FOREIGN_KEYS
     TABLE_NAME = SONGS_TABLE_NAME
     SPOTIFY_ENTITY_NAME = "track"
 
-    @classmethod
-    def make_init_data(
-        cls,
-        *,
-        track_spotify_id: str | BasicFieldValue = UNSET,
-        track_title: str | BasicFieldValue = UNSET,
-        song_genius_id: int | BasicFieldValue = UNSET,
-        primary_artist_id: str | BasicFieldValue = UNSET,
-        album_spotify_id: str | BasicFieldValue = UNSET,
-        disc_number: int | BasicFieldValue = UNSET,
-        track_number: int | BasicFieldValue = UNSET,
-        duration_ms: int | BasicFieldValue = UNSET,
-        explicit: bool | BasicFieldValue = UNSET,
-        popularity: int | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_id_col_name(): track_spotify_id,
-            cls.get_title_col_name(): track_title,
-            cls.get_genius_id_col_name(GeniusSongInfo): song_genius_id,
-            cls.get_primary_artist_id_col_name(): primary_artist_id,
-            cls.get_album_id_col_name(): album_spotify_id,
-            cls.get_disc_number_col_name(): disc_number,
-            cls.get_track_number_col_name(): track_number,
-            "duration_ms": duration_ms,
-            "explicit": explicit,
-            "popularity": popularity,
-        }
-        return cls._filter_data(fields)
-
     @classmethod
     def get_genius_id_col_name(cls, genius_entity_cls: type[GeniusEntity] | None = None) -> str:
-        return super().get_genius_id_col_name(GeniusSongInfo)
+        return cls.get_fk_name_ref_single_pk_entity(GeniusSongInfo)
 
     def get_genius_id(
         self,
         genius_entity_cls: type[GeniusEntity] | None = None,
     ) -> int | BasicFieldValue:
-        return super().get_genius_id(GeniusSongInfo)
+        return self.get_fk_value_ref_single_pk_entity(GeniusSongInfo)
 
     def set_genius_id(
         self,
         new_id: int | BasicFieldValue,
         genius_entity_cls: type[GeniusEntity] | None = None,
     ) -> None:
-        super().set_genius_id(new_id, GeniusSongInfo)
+        self.set_fk_value_ref_single_pk_entity(GeniusSongInfo, new_id)
 
     @classmethod
     def get_primary_artist_id_col_name(cls) -> str:
@@ -425,22 +375,30 @@ class Song(SpotifyEntity):
 
 class DiscographyEntry(BinaryAssociationEntity):
     TABLE_META = DISCOGRAPHY_TABLE_META
+    _INIT_FIELD_MAP = DISCOGRAPHY_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = DISCOGRAPHY_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = DISCOGRAPHY_TABLE_FOREIGN_KEYS
     TABLE_NAME = DISCOGRAPHY_TABLE_NAME
 
     @classmethod
-    def make_init_data(
+    def make_pk_row(
         cls,
         *,
-        artist_spotify_id: str | BasicFieldValue = UNSET,
-        track_spotify_id: str | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_artist_id_col_name(): artist_spotify_id,
-            cls.get_song_id_col_name(): track_spotify_id,
-        }
-        return cls._filter_data(fields)
+        artist_spotify_id: str,
+        track_spotify_id: str,
+    ) -> tuple[str, str]:
+        """
+        Build a primary key row ordered like PRIMARY_KEYS, for the insert_pk_row/insert_many_pk_rows fast path.
+        """
+        if cls._is_artist_id_first_pk():
+            return artist_spotify_id, track_spotify_id
+        return track_spotify_id, artist_spotify_id
+
+    @classmethod
+    @cache
+    def _is_artist_id_first_pk(cls) -> bool:
+        # resolved once per class, so make_pk_row builds its tuple without any per-row lookups
+        return cls.get_pk_names()[0] == cls.get_artist_id_col_name()
 
     @classmethod
     def get_artist_id_col_name(cls) -> str:
@@ -465,6 +423,7 @@ class DiscographyEntry(BinaryAssociationEntity):
 
 class Artist(SpotifyEntity):
     TABLE_META = ARTISTS_TABLE_META
+    _INIT_FIELD_MAP = ARTISTS_TABLE_INIT_FIELD_MAP
     PRIMARY_KEYS = ARTISTS_TABLE_PRIMARY_KEYS
     FOREIGN_KEYS = ARTISTS_TABLE_FOREIGN_KEYS
     TABLE_NAME = ARTISTS_TABLE_NAME
@@ -476,12 +435,33 @@ class Artist(SpotifyEntity):
         song: Song,
         simulate: bool = False,
     ) -> None:
-        entry_data = DiscographyEntry.make_init_data(
+        pk_row = DiscographyEntry.make_pk_row(
             artist_spotify_id=self.get_id(),
             track_spotify_id=song.get_id(),
         )
-        entry = DiscographyEntry(data=entry_data)
-        entry.insert_to_db(cur=cur, simulate=simulate)
+        DiscographyEntry.insert_pk_row(cur=cur, pk_row=pk_row, simulate=simulate)
+
+    def register_discography_entries(
+        self,
+        cur: sqlite3.Cursor,
+        songs: Sequence[Song],
+        simulate: bool = False,
+    ) -> None:
+        artist_id = self.get_id()
+        pk_rows = [
+            DiscographyEntry.make_pk_row(artist_spotify_id=artist_id, track_spotify_id=song.get_id())
+            for song in songs
+        ]
+        DiscographyEntry.insert_many_pk_rows(cur=cur, pk_rows=pk_rows, simulate=simulate)
+
+    def validate_image(self, image: ArtistImage) -> None:
+        self.validate_images((image,))
+
+    def validate_images(self, images: Sequence[ArtistImage]) -> None:
+        artist_id = self.get_id()  # read once for the whole batch
+        for image in images:
+            if image.get_artist_id() != artist_id:
+                raise ValueError(err_msg("an image attached to an artist must reference its artist_id"))
 
     def register_image(
         self,
@@ -489,47 +469,34 @@ class Artist(SpotifyEntity):
         image: ArtistImage,
         simulate: bool = False,
     ) -> None:
-        if self.get_id() != image.get_artist_id():
-            raise ValueError(err_msg("an image attached to an artist must reference its artist_id"))
+        self.validate_image(image)
         image.upsert_to_db(cur=cur, simulate=simulate)
 
-    @classmethod
-    def make_init_data(
-        cls,
-        *,
-        artist_spotify_id: str | BasicFieldValue = UNSET,
-        artist_name: str | BasicFieldValue = UNSET,
-        artist_genius_id: int | BasicFieldValue = UNSET,
-        total_followers: int | BasicFieldValue = UNSET,
-        genres: str | BasicFieldValue = UNSET,
-        popularity: int | BasicFieldValue = UNSET,
-    ) -> dict:
-        fields = {
-            cls.get_id_col_name(): artist_spotify_id,
-            cls.get_name_col_name(): artist_name,
-            cls.get_genius_id_col_name(): artist_genius_id,
-            "total_followers": total_followers,
-            "genres": genres,
-            "popularity": popularity,
-        }
-        return cls._filter_data(fields)
+    def register_images(
+        self,
+        cur: sqlite3.Cursor,
+        images: Sequence[ArtistImage],
+        simulate: bool = False,
+    ) -> None:
+        self.validate_images(images)
+        ArtistImage.upsert_many_to_db(cur=cur, entities=images, simulate=simulate)
 
     @classmethod
     def get_genius_id_col_name(cls, genius_entity_cls: type[GeniusEntity] | None = None) -> str:
-        return super().get_genius_id_col_name(GeniusArtistInfo)
+        return cls.get_fk_name_ref_single_pk_entity(GeniusArtistInfo)
 
     def get_genius_id(
         self,
         genius_entity_cls: type[GeniusEntity] | None = None,
     ) -> int | BasicFieldValue:
-        return super().get_genius_id(GeniusArtistInfo)
+        return self.get_fk_value_ref_single_pk_entity(GeniusArtistInfo)
 
     def set_genius_id(
         self,
         new_id: int | BasicFieldValue,
         genius_entity_cls: type[GeniusEntity] | None = None,
     ) -> None:
-        super().set_genius_id(new_id, GeniusArtistInfo)
+        self.set_fk_value_ref_single_pk_entity(GeniusArtistInfo, new_id)
 
     @classmethod
     def get_name_col_name(cls) -> str:
@@ -567,11 +534,6 @@ class Artist(SpotifyEntity):
             WHERE d.{DiscographyEntry.get_artist_id_col_name()} = :aid
             {order_clause};
         """
-        old_row_factory = cur.row_factory
-        cur.row_factory = sqlite3.Row  # type: ignore
-        try:
-            cur.execute(sql, {"aid": self.get_id()})
-        finally:
-            cur.row_factory = old_row_factory
-
+        # rows are built by the connection's row factory (sqlite3.Row, set once in Session.open)
+        cur.execute(sql, {"aid": self.get_id()})
         return cur.fetchall()
@@ -1,6 +1,7 @@
+import json
 import sqlite3
 from collections.abc import Sequence
-from typing import Any
+from typing import Any, Final
 
 from sp2genius.utils.errors import err_msg
 
@@ -11,19 +12,53 @@ from ..core.typing import TableColumn
 from .entities import Album, AlbumImage, Artist, ArtistImage, DiscographyEntry, Song, SpotifyEntity
 
 
+# Built once at import time, so every call reuses the same SQL text (and the connection's statement cache entry)
+_SQL_SONGS_FOR_ARTIST: Final[str] = f"""
+SELECT {DiscographyEntry.get_song_id_col_name()}
+FROM {DiscographyEntry.get_table_name()}
+WHERE {DiscographyEntry.get_artist_id_col_name()} = :aid
+"""
+
+# Intersect (GROUP BY/HAVING over the distinct artist ids, bound as a single JSON array), fetch and sort in one query
+_SQL_JOINT_SONGS: Final[str] = f"""
+SELECT s.*
+FROM {Song.get_table_name()} AS s
+JOIN (
+    SELECT d.{DiscographyEntry.get_song_id_col_name()}
+    FROM {DiscographyEntry.get_table_name()} AS d
+    WHERE d.{DiscographyEntry.get_artist_id_col_name()} IN (SELECT value FROM json_each(:artist_ids))
+    GROUP BY d.{DiscographyEntry.get_song_id_col_name()}
+    HAVING COUNT(DISTINCT d.{DiscographyEntry.get_artist_id_col_name()}) = :n_artists
+) AS t
+  ON t.{DiscographyEntry.get_song_id_col_name()} = s.{Song.get_id_col_name()}
+{generate_order_by_clause("s", Song.get_order_by_cols())};
+"""
+
+_SQL_EXISTING_ARTIST_IDS: Final[str] = f"""
+SELECT {Artist.get_id_col_name()}
+FROM {Artist.get_table_name()}
+WHERE {Artist.get_id_col_name()} IN (SELECT value FROM json_each(:artist_ids))
+"""
+
+
 def _ensure_discography_entries(
     cur: sqlite3.Cursor,
     *,
     song: Song,
     artists: Sequence[Artist],
 ) -> None:
-    for artist in artists:
-        artist.register_discography_entry(cur, song)
+    # One executemany for all artists instead of a DiscographyEntry + execute per artist
+    track_id = song.get_id()
+    pk_rows = [
+        DiscographyEntry.make_pk_row(artist_spotify_id=artist.get_id(), track_spotify_id=track_id)
+        for artist in artists
+    ]
+    DiscographyEntry.insert_many_pk_rows(cur=cur, pk_rows=pk_rows)
 
 
 # --- Public API: insert_song --------------------------------------------------
 def insert_spotify_song(
-    conn: sqlite3.Connection,
+    cur: sqlite3.Cursor,
     *,
     song: Song,
     primary_artist: tuple[Artist, Sequence[ArtistImage]],
@@ -35,38 +70,39 @@ def insert_spotify_song(
     For cases where no images (artist or album) exist pass an empty list for images.
     For featured artists, pass an empty list if none exist.
     - Keys we pass to helpers are column names: artist_id, name, album_id, title, etc.
-    - Helpers will UPDATE first (patch existing row) and INSERT only if no row exists.
+    - Helpers upsert (patch an existing row or insert a new one), images are written in one batch per table.
+    - Rows are written parents first: artists -> artist images -> album -> album images -> song -> discography,
+      so every foreign key holds when its row is written. Session.transaction defers the checks to COMMIT anyway,
+      keep this order if foreign keys are ever enforced per statement again.
     """
 
-    cur = conn.cursor()
-
-    # 1. main artist (only set what we know)
-    primary_artist_obj, primary_artist_images = primary_artist
-    primary_artist_obj.upsert_to_db(cur)
-    for artist_image in primary_artist_images:
-        primary_artist_obj.register_image(cur, artist_image)
-
-    feat_artist_objects = []
-    # 2. featured artists (if provided)
-    for feat_artist_obj, feat_artist_images in featured_artists:
-        feat_artist_objects.append(feat_artist_obj)
-        feat_artist_obj.upsert_to_db(cur)
-        for artist_image in feat_artist_images:
-            feat_artist_obj.register_image(cur, artist_image)
-
-    all_artists = [primary_artist_obj] + feat_artist_objects
+    # 1-2. main artist + featured artists (only set what we know) and their images, gathered in a single pass
+    # The image owner checks guard against API misuse only, so they are skipped under python -O.
+    primary_artist_obj = primary_artist[0]
+    all_artists: list[Artist] = []
+    all_artist_images: list[ArtistImage] = []
+    for artist_obj, artist_images in (primary_artist, *featured_artists):
+        if __debug__:
+            artist_obj.validate_images(artist_images)
+        all_artists.append(artist_obj)
+        all_artist_images.extend(artist_images)
+    # one batch per table, artists before their images
+    Artist.upsert_many_to_db(cur=cur, entities=all_artists)
+    ArtistImage.upsert_many_to_db(cur=cur, entities=all_artist_images)
 
     # 3. album (patch or insert)
     album_obj, album_images = album
     if album_obj.get_id() != song.get_album_id():
         raise ValueError(err_msg("Song's album_id must match the provided album's album_id"))
-    if album_obj.get_primary_artist_id() not in {artist.get_id() for artist in all_artists}:
+    album_primary_artist_id = album_obj.get_primary_artist_id()
+    if not any(album_primary_artist_id == artist.get_id() for artist in all_artists):
         raise ValueError(
             err_msg("Album's primary_artist_id must match one of the provided artists' artist_id")
         )
     album_obj.upsert_to_db(cur)
-    for album_image in album_images:
-        album_obj.register_image(cur, album_image)
+    if __debug__:
+        album_obj.validate_images(album_images)
+    AlbumImage.upsert_many_to_db(cur=cur, entities=album_images)
 
     # 4. song (patch or insert)
     if song.get_primary_artist_id() != primary_artist_obj.get_id():
@@ -79,6 +115,26 @@ def insert_spotify_song(
     _ensure_discography_entries(cur, song=song, artists=all_artists)
 
 
+def _ensure_artists_exist(cur: sqlite3.Cursor, artists: Sequence[Artist]) -> None:
+    """
+    Check the existence of all the given artists with a single query, reporting the first missing one.
+    """
+    artist_ids = list(dict.fromkeys(artist.get_id() for artist in artists))
+    cur.execute(_SQL_EXISTING_ARTIST_IDS, {"artist_ids": json.dumps(artist_ids)})
+    existing_ids = {row[0] for row in cur}
+    for artist_id in artist_ids:
+        if artist_id not in existing_ids:
+            raise ValueError(
+                err_msg(f"Artist '{artist_id}' does not exist in table '{Artist.get_table_name()}'.")
+            )
+
+
+def _select_tracks_for_artist(cur: sqlite3.Cursor, artist: Artist) -> set[str]:
+    cur.execute(_SQL_SONGS_FOR_ARTIST, {"aid": artist.get_id()})
+    # Stream rows from the cursor instead of materializing them with fetchall()
+    return {row[0] for row in cur}
+
+
 def get_tracks_for_artist(
     conn: sqlite3.Connection,
     *,
@@ -86,23 +142,12 @@ def get_tracks_for_artist(
     strict: bool = False,
 ) -> set[str]:
     cur = conn.cursor()
+    tracks = _select_tracks_for_artist(cur, artist)
 
-    if strict:
-        if not artist.exists_in_db(cur):
-            raise ValueError(
-                err_msg(f"Artist '{artist.get_id()}' does not exist in table 'artists'.")
-            )
-
-    cur.execute(
-        f"""
-        SELECT {DiscographyEntry.get_song_id_col_name()}
-        FROM {DiscographyEntry.get_table_name()}
-        WHERE {DiscographyEntry.get_artist_id_col_name()} = :aid
-        """,
-        {"aid": artist.get_id()},
-    )
-    rows = cur.fetchall()
-    return {row[0] for row in rows}
+    # A discography entry implies the artist exists (foreign key), so only an empty result needs the existence check
+    if strict and not tracks:
+        _ensure_artists_exist(cur, (artist,))
+    return tracks
 
 
 def get_joint_songs_for_artists(
@@ -115,54 +160,30 @@ def get_joint_songs_for_artists(
     Given a list of artist_ids, return a list of sqlite3.Row objects representing
     songs that ALL of these artists participated in (intersection of their tracks).
 
-    - Uses the discography table to find shared track_ids.
-    - Then fetches full rows from the songs table.
+    - Finds the shared track_ids in the discography table with GROUP BY/HAVING.
+    - Fetches the full rows from the songs table in the same query.
     - Result is sorted by: main_artist_id, then album_id, then disc_number, then track_number.
+    - Rows come from the connection's row factory (Session.open sets sqlite3.Row).
     """
     assert isinstance(artists, Sequence), err_msg("artists must be a sequence of Artist objects")
     if not artists:
         return []
 
-    # 1. Build the intersection of track IDs across all artists
-    track_sets: list[set[str]] = []
-    for artist in artists:
-        tracks = get_tracks_for_artist(conn, artist=artist, strict=strict)
-        track_sets.append(tracks)
-
-    # Start with a copy of the first set, then intersect with the rest
-    joint_tracks: set[str] = set(track_sets[0])
-    for s in track_sets[1:]:
-        joint_tracks.intersection_update(s)
-
-    if not joint_tracks:
-        return []
+    cur = conn.cursor()
 
-    # 2. Fetch full song rows for all intersecting track_ids, using sqlite3.Row
-    track_list = list(joint_tracks)
-    placeholders = ", ".join("?" for _ in track_list)
+    # Deduplicate (keeping the input order), so the HAVING count matches the number of distinct artists
+    artist_ids = list(dict.fromkeys(artist.get_id() for artist in artists))
 
-    cur = conn.cursor()
-    cur.row_factory = sqlite3.Row  # type: ignore
+    # Intersect, fetch and sort in a single query
     cur.execute(
-        f"""
-        SELECT *
-        FROM {Song.get_table_name()}
-        WHERE {Song.get_id_col_name()} IN ({placeholders})
-        """,
-        track_list,
+        _SQL_JOINT_SONGS,
+        {"artist_ids": json.dumps(artist_ids), "n_artists": len(artist_ids)},
     )
     songs = cur.fetchall()
 
-    # 3. Sort by main_artist_id, then album_id, then title
-    songs.sort(
-        key=lambda song: (
-            song[Song.get_primary_artist_id_col_name()],
-            song[Song.get_album_id_col_name()],
-            song[Song.get_disc_number_col_name()],
-            song[Song.get_track_number_col_name()],
-        )
-    )
-
+    # A joint song implies every artist exists (foreign key), so only an empty result needs the existence checks
+    if strict and not songs:
+        _ensure_artists_exist(cur, artists)
     return songs
 
 
@@ -265,7 +286,6 @@ def select_songs_including_all_artists(
         raise ValueError("artists list must contain at least one distinct artist id")
 
     cur = conn.cursor()
-    cur.row_factory = sqlite3.Row  # type: ignore
 
     # Case 2: single artist
     if n == 1:
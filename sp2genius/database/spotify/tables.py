@@ -11,6 +11,7 @@ from ..core.typing import (
     CreateStatement,
     FieldMeta,
     ForeignKeyMapping,
+    InitFieldMap,
     PrimaryKeyNames,
     TableMeta,
     TableName,
@@ -95,6 +96,14 @@ ARTISTS_TABLE_META: Final[TableMeta] = {
     "genres": FieldMeta(py_type=str, nullable=True),
     "popularity": FieldMeta(py_type=int, nullable=True),
 }
+ARTISTS_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("artist_spotify_id", ARTISTS_TABLE_PRIMARY_KEYS[0]),
+    ("artist_name", "name"),
+    ("artist_genius_id", ARTISTS_TABLE_FOREIGN_KEYS[GENIUS_ARTIST_INFO_TABLE_NAME][GENIUS_ARTIST_INFO_TABLE_PRIMARY_KEYS[0]]),
+    ("total_followers", "total_followers"),
+    ("genres", "genres"),
+    ("popularity", "popularity"),
+)
 
 # Albums Table
 ALBUMS_TABLE_NAME: Final[TableName] = "albums"
@@ -161,6 +170,17 @@ ALBUMS_TABLE_META: Final[TableMeta] = {
     "label": FieldMeta(py_type=str, nullable=True),
     "popularity": FieldMeta(py_type=int, nullable=True),
 }
+ALBUMS_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("album_spotify_id", ALBUMS_TABLE_PRIMARY_KEYS[0]),
+    ("album_title", "title"),
+    ("album_genius_id", ALBUMS_TABLE_FOREIGN_KEYS[GENIUS_ALBUM_INFO_TABLE_NAME][GENIUS_ALBUM_INFO_TABLE_PRIMARY_KEYS[0]]),
+    ("primary_artist_id", ALBUMS_TABLE_FOREIGN_KEYS[ARTISTS_TABLE_NAME][ARTISTS_TABLE_PRIMARY_KEYS[0]]),
+    ("album_type", "album_type"),
+    ("total_tracks", "total_tracks"),
+    ("release_date", "release_date"),
+    ("label", "label"),
+    ("popularity", "popularity"),
+)
 
 # Songs Table
 SONGS_TABLE_NAME: Final[TableName] = "songs"
@@ -225,6 +245,18 @@ SONGS_TABLE_META: Final[TableMeta] = {
     "explicit": FieldMeta(py_type=bool, nullable=False),
     "popularity": FieldMeta(py_type=int, nullable=True),
 }
+SONGS_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("track_spotify_id", SONGS_TABLE_PRIMARY_KEYS[0]),
+    ("track_title", "title"),
+    ("song_genius_id", SONGS_TABLE_FOREIGN_KEYS[GENIUS_SONG_INFO_TABLE_NAME][GENIUS_SONG_INFO_TABLE_PRIMARY_KEYS[0]]),
+    ("primary_artist_id", SONGS_TABLE_FOREIGN_KEYS[ARTISTS_TABLE_NAME][ARTISTS_TABLE_PRIMARY_KEYS[0]]),
+    ("album_spotify_id", SONGS_TABLE_FOREIGN_KEYS[ALBUMS_TABLE_NAME][ALBUMS_TABLE_PRIMARY_KEYS[0]]),
+    ("disc_number", "disc_number"),
+    ("track_number", "track_number"),
+    ("duration_ms", "duration_ms"),
+    ("explicit", "explicit"),
+    ("popularity", "popularity"),
+)
 
 # Discography Table
 DISCOGRAPHY_TABLE_NAME: Final[TableName] = "discography"
@@ -233,6 +265,7 @@ CREATE TABLE IF NOT EXISTS {DISCOGRAPHY_TABLE_NAME} (
     artist_id TEXT NOT NULL,
     track_id  TEXT NOT NULL,
 
+    -- The primary key index also covers lookups by artist_id alone (index-only scan for track_id)
     PRIMARY KEY (artist_id, track_id),
 
     FOREIGN KEY (artist_id)
@@ -257,6 +290,10 @@ DISCOGRAPHY_TABLE_META: Final[TableMeta] = {
     "artist_id": FieldMeta(py_type=str, nullable=False),
     "track_id": FieldMeta(py_type=str, nullable=False),
 }
+DISCOGRAPHY_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("artist_spotify_id", DISCOGRAPHY_TABLE_FOREIGN_KEYS[ARTISTS_TABLE_NAME][ARTISTS_TABLE_PRIMARY_KEYS[0]]),
+    ("track_spotify_id", DISCOGRAPHY_TABLE_FOREIGN_KEYS[SONGS_TABLE_NAME][SONGS_TABLE_PRIMARY_KEYS[0]]),
+)
 
 # Artist Images Table
 ARTIST_IMAGES_TABLE_NAME: Final[TableName] = "artist_images"
@@ -292,6 +329,12 @@ ARTIST_IMAGES_TABLE_META: Final[TableMeta] = {
     "width": FieldMeta(py_type=int, nullable=True),
     "height": FieldMeta(py_type=int, nullable=True),
 }
+ARTIST_IMAGES_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("artist_spotify_id", ARTIST_IMAGES_TABLE_FOREIGN_KEYS[ARTISTS_TABLE_NAME][ARTISTS_TABLE_PRIMARY_KEYS[0]]),
+    ("image_url", "url"),
+    ("image_width", "width"),
+    ("image_height", "height"),
+)
 
 # Album Images Table
 ALBUM_IMAGES_TABLE_NAME: Final[TableName] = "album_images"
@@ -327,6 +370,12 @@ ALBUM_IMAGES_TABLE_META: Final[TableMeta] = {
     "width": FieldMeta(py_type=int, nullable=True),
     "height": FieldMeta(py_type=int, nullable=True),
 }
+ALBUM_IMAGES_TABLE_INIT_FIELD_MAP: Final[InitFieldMap] = (
+    ("album_spotify_id", ALBUM_IMAGES_TABLE_FOREIGN_KEYS[ALBUMS_TABLE_NAME][ALBUMS_TABLE_PRIMARY_KEYS[0]]),
+    ("image_url", "url"),
+    ("image_width", "width"),
+    ("image_height", "height"),
+)
 
 # All Tables Creation Statements in Order of Dependencies
 TABLES: Final[list[CreateStatement]] = [
@@ -337,3 +386,17 @@ TABLES: Final[list[CreateStatement]] = [
     ARTIST_IMAGES_TABLE,
     ALBUM_IMAGES_TABLE,
 ]
+
+# ---- SPOTIFY INDEXES ---- #
+# Kept out of the CREATE TABLE statements, so they can be (re)applied idempotently to existing databases as well
+
+# Reverse lookups (artists of a track, and the ON DELETE CASCADE from songs) as an index-only scan
+DISCOGRAPHY_TRACK_INDEX: Final[CreateStatement] = f"""
+CREATE INDEX IF NOT EXISTS idx_{DISCOGRAPHY_TABLE_NAME}_track
+    ON {DISCOGRAPHY_TABLE_NAME}(track_id, artist_id);
+"""
+
+# All Indexes Creation Statements (run after the tables exist)
+INDEXES: Final[list[CreateStatement]] = [
+    DISCOGRAPHY_TRACK_INDEX,
+]